@@ -0,0 +1,65 @@
+"""
+Server-side filtering with aggrid_filter (Polars) vs client-side filtering of the shipped rows.
+
+client: the whole frame is serialized for rowData, then every row is tested one by one,
+        as AG Grid does in the browser (a Python loop stands in for the JavaScript predicate)
+server: the filterModel is translated to one Polars expression, only matching rows are serialized
+
+Usage:
+    python utils/aggrid_filter_benchmark.py [--rows 100000 1000000]
+"""
+import argparse
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.common.synthetic import cards_frame, timed
+from web.components.aggrid_filter import apply_models
+
+FILTER_MODEL = {
+    'description': {'filterType': 'text', 'type': 'contains', 'filter': '99'},
+    'value': {'filterType': 'number', 'type': 'greaterThan', 'filter': 500},
+    'created_date': {'filterType': 'date', 'type': 'inRange',
+                     'dateFrom': '2024-03-01 00:00:00', 'dateTo': '2024-09-30 00:00:00'},
+}
+
+
+def client_side(df: pl.DataFrame):
+    payload = json.dumps(df.to_dicts(), default=str)
+    date_from, date_to = date(2024, 3, 1), date(2024, 9, 30)
+    rows = [row for row in df.to_dicts()
+            if '99' in row['description'].lower() and row['value'] > 500
+            and date_from < row['created_date'] < date_to]
+    return len(payload), len(rows)
+
+
+def server_side(df: pl.DataFrame):
+    result = apply_models(df, None, FILTER_MODEL)
+    return len(result.write_json()), result.height
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>11} {'mode':<7} {'ms':>10} {'payload KiB':>12} {'matches':>9}")
+    for rows in args.rows:
+        df = cards_frame(rows)
+        (client_bytes, client_matches), client_seconds = timed(client_side, df)
+        (server_bytes, server_matches), server_seconds = timed(server_side, df)
+        assert client_matches == server_matches, (client_matches, server_matches)
+        print(f"{rows:>11,} {'client':<7} {client_seconds * 1000:>10.1f} {client_bytes / 1024:>12.0f} "
+              f"{client_matches:>9,}")
+        print(f"{rows:>11,} {'server':<7} {server_seconds * 1000:>10.1f} {server_bytes / 1024:>12.0f} "
+              f"{server_matches:>9,}")
+
+
+if __name__ == '__main__':
+    main()
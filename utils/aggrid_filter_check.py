@@ -0,0 +1,126 @@
+"""
+Checks aggrid_filter.apply_models against AG Grid filterModel/sortModel fixtures.
+
+Each fixture is a filter model as the grid sends it, the sort model and the expected
+'name' column of the result, in order. Exits with status 1 when a fixture fails.
+
+Usage:
+    python utils/aggrid_filter_check.py
+"""
+import sys
+from datetime import date
+from pathlib import Path
+
+import polars as pl
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from web.components.aggrid_filter import apply_models
+
+DF = pl.DataFrame({
+    'name': ['Card 1', 'Card 2', 'Card 3', 'Card 4', 'Card 5'],
+    'description': ['Alpha', 'beta', None, 'Alphabet', ''],
+    'quantity': pl.Series([10, 20, 30, None, 50], dtype=pl.Int32),
+    'value': pl.Series([1.5, 3.0, 4.5, 6.0, 7.5], dtype=pl.Float32),
+    'active': [False, True, False, True, None],
+    'created_date': [date(2024, 1, 1), date(2024, 1, 2), date(2024, 1, 3), None, date(2024, 1, 5)],
+})
+
+ALL = ['Card 1', 'Card 2', 'Card 3', 'Card 4', 'Card 5']
+
+# (name, filterModel, sortModel, expected names)
+FIXTURES = [
+    ('no model', None, None, ALL),
+    ('empty model', {}, [], ALL),
+
+    # text
+    ('text contains, case-insensitive', {'description': {'filterType': 'text', 'type': 'contains', 'filter': 'ALPHA'}},
+     None, ['Card 1', 'Card 4']),
+    ('text notContains keeps blanks', {'description': {'filterType': 'text', 'type': 'notContains', 'filter': 'alpha'}},
+     None, ['Card 2', 'Card 3', 'Card 5']),
+    ('text equals', {'description': {'filterType': 'text', 'type': 'equals', 'filter': 'beta'}}, None, ['Card 2']),
+    ('text notEqual keeps blanks', {'description': {'filterType': 'text', 'type': 'notEqual', 'filter': 'beta'}},
+     None, ['Card 1', 'Card 3', 'Card 4', 'Card 5']),
+    ('text startsWith', {'name': {'filterType': 'text', 'type': 'startsWith', 'filter': 'card 1'}}, None, ['Card 1']),
+    ('text endsWith', {'description': {'filterType': 'text', 'type': 'endsWith', 'filter': 'bet'}}, None, ['Card 4']),
+    ('text blank', {'description': {'filterType': 'text', 'type': 'blank'}}, None, ['Card 3', 'Card 5']),
+    ('text notBlank', {'description': {'filterType': 'text', 'type': 'notBlank'}},
+     None, ['Card 1', 'Card 2', 'Card 4']),
+    ('text on a number column', {'quantity': {'filterType': 'text', 'type': 'startsWith', 'filter': '2'}},
+     None, ['Card 2']),
+    ('text OR conditions', {'name': {'filterType': 'text', 'operator': 'OR', 'conditions': [
+        {'filterType': 'text', 'type': 'equals', 'filter': 'card 2'},
+        {'filterType': 'text', 'type': 'endsWith', 'filter': '5'}]}}, None, ['Card 2', 'Card 5']),
+    ('text AND conditions', {'description': {'filterType': 'text', 'operator': 'AND', 'conditions': [
+        {'filterType': 'text', 'type': 'contains', 'filter': 'alpha'},
+        {'filterType': 'text', 'type': 'notEqual', 'filter': 'alpha'}]}}, None, ['Card 4']),
+
+    # number
+    ('number equals', {'quantity': {'filterType': 'number', 'type': 'equals', 'filter': 30}}, None, ['Card 3']),
+    ('number notEqual drops blanks', {'quantity': {'filterType': 'number', 'type': 'notEqual', 'filter': 30}},
+     None, ['Card 1', 'Card 2', 'Card 5']),
+    ('number greaterThan', {'value': {'filterType': 'number', 'type': 'greaterThan', 'filter': 4.5}},
+     None, ['Card 4', 'Card 5']),
+    ('number greaterThanOrEqual', {'value': {'filterType': 'number', 'type': 'greaterThanOrEqual', 'filter': 4.5}},
+     None, ['Card 3', 'Card 4', 'Card 5']),
+    ('number lessThan', {'quantity': {'filterType': 'number', 'type': 'lessThan', 'filter': 20}}, None, ['Card 1']),
+    ('number lessThanOrEqual', {'quantity': {'filterType': 'number', 'type': 'lessThanOrEqual', 'filter': 20}},
+     None, ['Card 1', 'Card 2']),
+    ('number inRange excludes bounds', {'quantity': {'filterType': 'number', 'type': 'inRange',
+                                                     'filter': 10, 'filterTo': 50}}, None, ['Card 2', 'Card 3']),
+    ('number blank', {'quantity': {'filterType': 'number', 'type': 'blank'}}, None, ['Card 4']),
+    ('number incomplete condition', {'quantity': {'filterType': 'number', 'type': 'equals', 'filter': None}},
+     None, ALL),
+
+    # date
+    ('date equals', {'created_date': {'filterType': 'date', 'type': 'equals', 'dateFrom': '2024-01-02 00:00:00'}},
+     None, ['Card 2']),
+    ('date greaterThan', {'created_date': {'filterType': 'date', 'type': 'greaterThan',
+                                           'dateFrom': '2024-01-02 00:00:00'}}, None, ['Card 3', 'Card 5']),
+    ('date lessThan', {'created_date': {'filterType': 'date', 'type': 'lessThan', 'dateFrom': '2024-01-02 00:00:00'}},
+     None, ['Card 1']),
+    ('date inRange', {'created_date': {'filterType': 'date', 'type': 'inRange', 'dateFrom': '2024-01-01 00:00:00',
+                                       'dateTo': '2024-01-05 00:00:00'}}, None, ['Card 2', 'Card 3']),
+    ('date notBlank', {'created_date': {'filterType': 'date', 'type': 'notBlank'}},
+     None, ['Card 1', 'Card 2', 'Card 3', 'Card 5']),
+
+    # set
+    ('set boolean', {'active': {'filterType': 'set', 'values': ['true']}}, None, ['Card 2', 'Card 4']),
+    ('set with blanks', {'active': {'filterType': 'set', 'values': ['false', None]}},
+     None, ['Card 1', 'Card 3', 'Card 5']),
+    ('set empty selects nothing', {'active': {'filterType': 'set', 'values': []}}, None, []),
+
+    # several columns are combined with AND
+    ('two columns', {'active': {'filterType': 'set', 'values': ['true']},
+                     'value': {'filterType': 'number', 'type': 'lessThan', 'filter': 5}}, None, ['Card 2']),
+
+    # unknown columns and filter types are ignored
+    ('unknown column', {'missing': {'filterType': 'text', 'type': 'contains', 'filter': 'x'}}, None, ALL),
+    ('unknown filter type', {'name': {'filterType': 'multi', 'filterModels': []}}, None, ALL),
+
+    # sort
+    ('sort desc', None, [{'colId': 'value', 'sort': 'desc'}], ['Card 5', 'Card 4', 'Card 3', 'Card 2', 'Card 1']),
+    ('sort nulls last', None, [{'colId': 'quantity', 'sort': 'asc'}],
+     ['Card 1', 'Card 2', 'Card 3', 'Card 5', 'Card 4']),
+    ('sort two columns', None, [{'colId': 'active', 'sort': 'desc'}, {'colId': 'value', 'sort': 'desc'}],
+     ['Card 4', 'Card 2', 'Card 3', 'Card 1', 'Card 5']),
+    ('sort unknown column', None, [{'colId': 'missing', 'sort': 'asc'}], ALL),
+    ('filter then sort', {'description': {'filterType': 'text', 'type': 'contains', 'filter': 'alpha'}},
+     [{'colId': 'name', 'sort': 'desc'}], ['Card 4', 'Card 1']),
+]
+
+
+def main():
+    failed = 0
+    for name, filter_model, sort_model, expected in FIXTURES:
+        result = apply_models(DF, sort_model, filter_model)['name'].to_list()
+        if result != expected:
+            failed += 1
+            print(f"FAIL {name}: expected {expected}, got {result}")
+    print(f"{len(FIXTURES) - failed}/{len(FIXTURES)} fixtures passed")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Client row model (whole frame as rowData) vs infinite row model (row blocks from Polars).
+
+client:   df.to_dicts() serialized to JSON, what AgGridPolars sends with row_model='client'
+infinite: sort + filter once per model change (first block), then a zero-copy slice per block,
+          what AgGridPolars.get_rows answers for row_model='infinite'
+
+Memory is the tracemalloc peak (Python objects, Polars' own buffers are not included).
+
+Usage:
+    python utils/aggrid_rowmodel_benchmark.py [--rows 100000 1000000 10000000] [--block-size 100]
+"""
+import argparse
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+import polars as pl
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.common.synthetic import cards_frame, timed
+from web.components.aggrid_filter import apply_models
+
+SORT_MODEL = [{'colId': 'value', 'sort': 'desc'}]
+FILTER_MODEL = {'description': {'filterType': 'text', 'type': 'contains', 'filter': '99'}}
+
+
+def measure(func):
+    """(result, seconds, tracemalloc peak bytes), timed without tracemalloc as it slows allocations down"""
+    _, elapsed = timed(func)
+    tracemalloc.start()
+    result = func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def client_payload(df: pl.DataFrame) -> bytes:
+    return json.dumps(df.to_dicts(), default=str).encode()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000, 10_000_000])
+    parser.add_argument('--block-size', type=int, default=100)
+    parser.add_argument('--client-limit', type=int, default=1_000_000,
+                        help='skip the client row model above this many rows')
+    args = parser.parse_args()
+
+    print(f"{'rows':>11} {'mode':<22} {'ms':>10} {'payload KiB':>12} {'peak MiB':>9}")
+    for rows in args.rows:
+        df = cards_frame(rows)
+
+        if rows <= args.client_limit:
+            payload, seconds, peak = measure(lambda: client_payload(df))
+            print(f"{rows:>11,} {'client (all rows)':<22} {seconds * 1000:>10.1f} "
+                  f"{len(payload) / 1024:>12.0f} {peak / 2 ** 20:>9.1f}")
+        else:
+            print(f"{rows:>11,} {'client (all rows)':<22} {'skipped':>10}")
+
+        view, seconds, peak = measure(lambda: apply_models(df, SORT_MODEL, FILTER_MODEL))
+        block, _, _ = measure(lambda: view.slice(0, args.block_size).write_json())
+        print(f"{rows:>11,} {'infinite sort+filter':<22} {seconds * 1000:>10.1f} "
+              f"{len(block) / 1024:>12.1f} {peak / 2 ** 20:>9.1f}")
+
+        offset = view.height // 2
+        block, seconds, peak = measure(lambda: view.slice(offset, args.block_size).write_json())
+        print(f"{rows:>11,} {'infinite next block':<22} {seconds * 1000:>10.3f} "
+              f"{len(block) / 1024:>12.1f} {peak / 2 ** 20:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
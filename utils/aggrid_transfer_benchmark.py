@@ -0,0 +1,81 @@
+"""
+Grid data transfer: to_dicts JSON rowData vs Arrow IPC (AgGridPolars(transfer='arrow')).
+
+json:        json.dumps(df.to_dicts()), the rowData path
+arrow:       to_arrow_ipc(df), uncompressed IPC stream
+arrow+gzip:  what /aggrid/{grid_id}/arrow sends to browsers accepting gzip
+arrow zstd / lz4: IPC buffer compression, for reference only (Arrow JS cannot decode it)
+
+CPU is process time of the serialization, peak is the growth of the process max RSS,
+each mode runs in a fresh process so the peaks do not hide each other.
+
+Usage:
+    python utils/aggrid_transfer_benchmark.py [--rows 100000 1000000] [--columns 6]
+"""
+import argparse
+import gzip
+import json
+import multiprocessing
+import resource
+import sys
+import time
+from pathlib import Path
+
+import polars as pl
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.common.synthetic import cards_frame
+from web.components.arrow_transfer import to_arrow_ipc
+
+MODES = {
+    'json': lambda df: json.dumps(df.to_dicts(), default=str).encode(),
+    'arrow': lambda df: to_arrow_ipc(df),
+    'arrow+gzip': lambda df: gzip.compress(to_arrow_ipc(df), compresslevel=1),
+    'arrow zstd': lambda df: to_arrow_ipc(df, compression='zstd'),
+    'arrow lz4': lambda df: to_arrow_ipc(df, compression='lz4'),
+}
+
+
+def make_frame(rows: int, columns: int) -> pl.DataFrame:
+    """The cards frame with 'columns' groups of a string, float, int and date column, and a duration column"""
+    return cards_frame(rows, groups=columns - 1).with_columns(
+        duration=((pl.int_range(pl.len()) % 86_400) * 1000).cast(pl.Duration('ms'))
+    )
+
+
+def max_rss() -> int:
+    """Max resident set size in bytes (ru_maxrss is KiB on Linux)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def run_mode(mode: str, rows: int, columns: int, queue):
+    df = make_frame(rows, columns)
+    baseline = max_rss()
+    start = time.process_time()
+    payload = MODES[mode](df)
+    cpu = time.process_time() - start
+    queue.put((len(payload), cpu, max_rss() - baseline))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--columns', type=int, default=6, help='column groups, 4 columns each')
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context('spawn')
+    print(f"{'rows':>11} {'mode':<12} {'payload KiB':>12} {'cpu ms':>9} {'peak MiB':>9}")
+    for rows in args.rows:
+        for mode in MODES:
+            queue = context.Queue()
+            process = context.Process(target=run_mode, args=(mode, rows, args.columns, queue))
+            process.start()
+            size, cpu, peak = queue.get()
+            process.join()
+            print(f"{rows:>11,} {mode:<12} {size / 1024:>12.0f} {cpu * 1000:>9.1f} {peak / 2 ** 20:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
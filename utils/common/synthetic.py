@@ -0,0 +1,39 @@
+import time
+from datetime import date
+from typing import Any, Callable, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+def cards_frame(rows: int, groups: int = 0) -> 'pl.DataFrame':
+    """
+    Synthetic cards frame shared by the benchmarks and the example pages:
+    name (unique), description (997 distinct), quantity, value, active and created_date.
+    groups adds that many suffixed description/value/quantity/created_date columns to vary the width.
+    """
+    import polars as pl
+
+    index = pl.int_range(0, rows, eager=True)
+    dates = pl.date_range(date(2024, 1, 1), date(2024, 12, 31), eager=True)
+    data = {
+        'name': 'Card ' + index.cast(pl.String),
+        'description': 'Description ' + (index % 997).cast(pl.String),
+        'quantity': (index % 1000).cast(pl.Int32),
+        'value': (index % 1000).cast(pl.Float64) * 1.5,
+        'active': index % 2 == 0,
+        'created_date': dates.gather(index % 366),
+    }
+    for i in range(1, groups + 1):
+        data[f'description_{i}'] = 'Description ' + ((index + i) % 997).cast(pl.String)
+        data[f'value_{i}'] = ((index + i) % 1000).cast(pl.Float64) * 1.5
+        data[f'quantity_{i}'] = (index * (i + 1)) % 100_000
+        data[f'created_date_{i}'] = dates.gather((index + i) % 366)
+    return pl.DataFrame(data)
+
+
+def timed(func: Callable, *args, **kwargs) -> Tuple[Any, float]:
+    """(result, seconds) of one call"""
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
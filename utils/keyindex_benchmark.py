@@ -0,0 +1,50 @@
+"""
+Resolving selected row ids to card dicts: one df.filter per id vs KeyIndex (one gather, one to_dicts).
+
+filter:    df.filter(pl.col('name') == card_name).to_dicts()[0] per selected card, a column scan each
+keyindex:  KeyIndex(df, 'name').dicts(selected), build time reported separately (done once per frame)
+
+Usage:
+    python utils/keyindex_benchmark.py [--rows 10000 100000] [--select 100 1000 10000]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+import polars as pl
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.common.synthetic import cards_frame, timed
+from web.components.keyindex import KeyIndex
+
+
+def per_card_filter(df: pl.DataFrame, selected: list) -> dict:
+    return {card_name: df.filter(pl.col('name') == card_name).to_dicts()[0] for card_name in selected}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 100_000])
+    parser.add_argument('--select', type=int, nargs='+', default=[100, 1_000, 10_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>9} {'selected':>9} {'filter ms':>10} {'build ms':>9} {'keyindex ms':>12}")
+    for rows in args.rows:
+        df = cards_frame(rows)
+        index, build_seconds = timed(KeyIndex, df, 'name')
+        for select in args.select:
+            if select > rows:
+                continue
+            # Spread over the frame from the end, so the ids are neither contiguous nor in frame order
+            selected = df['name'].reverse().gather_every(max(rows // select, 1)).head(select).to_list()
+            cards, index_seconds = timed(index.dicts, selected)
+            expected, filter_seconds = timed(per_card_filter, df, selected)
+            assert cards == expected
+            print(f"{rows:>9,} {select:>9,} {filter_seconds * 1000:>10.1f} {build_seconds * 1000:>9.1f} "
+                  f"{index_seconds * 1000:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
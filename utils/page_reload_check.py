@@ -0,0 +1,53 @@
+"""
+Checks that Reload (ModuleReloader.reload_project_modules) picks up added and removed page files
+when no loaded module changed, as the header Reload button does without watch_pages.
+Exits with status 1 when a check fails.
+
+Usage:
+    python utils/page_reload_check.py
+"""
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from web.components.modulereloader import ModuleReloader
+from web.components.pagemanager import PageManager
+
+
+def main():
+    results = []
+
+    def check(name: str, condition: bool):
+        results.append(condition)
+        if not condition:
+            print(f"FAIL {name}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pages_dir = Path(tmp) / 'web' / 'pages'
+        (pages_dir / 'cards').mkdir(parents=True)
+        (pages_dir / 'cards' / 'first_page.py').write_text('class FirstPage:\n    pass\n')
+        reloader = ModuleReloader()
+
+        for index_file in (None, Path(tmp) / 'pageindex.json'):
+            mode = 'index' if index_file else 'scan'
+            pagemanager = PageManager(pages_dir=pages_dir, index_file=index_file)
+            check(f'{mode}: initial pages', set(pagemanager.get_pages()) == {'/cards/first'})
+
+            (pages_dir / 'cards' / 'second_page.py').write_text('class SecondPage:\n    pass\n')
+            result = reloader.reload_project_modules()
+            check(f'{mode}: no module changed', not result.reloaded)
+            check(f'{mode}: new page after Reload', set(pagemanager.get_pages()) == {'/cards/first', '/cards/second'})
+
+            (pages_dir / 'cards' / 'second_page.py').unlink()
+            reloader.reload_project_modules()
+            check(f'{mode}: removed page after Reload', set(pagemanager.get_pages()) == {'/cards/first'})
+
+    print(f"{sum(results)}/{len(results)} checks passed")
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == '__main__':
+    main()
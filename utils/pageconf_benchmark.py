@@ -0,0 +1,56 @@
+"""
+Per-render cost of reading the page configuration.
+
+before: globalpageconf.load(route) + DictConfig.get() per key (what PageTemplate did)
+after:  globalpageconf.route_conf(route) + attribute access on the compiled RouteConf
+
+Usage:
+    python utils/pageconf_benchmark.py [--renders 10000]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from web.components.pageconf import globalpageconf
+
+ROUTES = ['/cards/cards_polars', '/cards/cards_modul', '/examples/example']
+KEYS = ['sidebar_width', 'sidebar_cards_grid_height', 'cards_per_row', 'card_height']
+
+
+def render_before(route):
+    conf = globalpageconf.load(route)
+    return [conf.get(key) for key in KEYS]
+
+
+def render_after(route):
+    conf = globalpageconf.route_conf(route)
+    return [conf.sidebar_width, conf.sidebar_cards_grid_height, conf.cards_per_row, conf.card_height]
+
+
+def measure(func, renders: int) -> float:
+    start = time.perf_counter()
+    for i in range(renders):
+        func(ROUTES[i % len(ROUTES)])
+    return (time.perf_counter() - start) / renders * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--renders', type=int, default=10000)
+    args = parser.parse_args()
+
+    for route in ROUTES:
+        render_after(route)  # compile once, like the first render after a save
+
+    before = measure(render_before, args.renders)
+    after = measure(render_after, args.renders)
+    print(f'before: {before:8.2f} us/render')
+    print(f'after:  {after:8.2f} us/render ({before / after:.0f}x)')
+
+
+if __name__ == '__main__':
+    main()
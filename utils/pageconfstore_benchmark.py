@@ -0,0 +1,51 @@
+"""
+Lookup and save cost of the per-user page configuration store with many users and routes.
+
+Usage:
+    python utils/pageconfstore_benchmark.py [--users 5000] [--routes 50] [--lookups 20000]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from web.components.pageconfstore import PageConfStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--users', type=int, default=5000)
+    parser.add_argument('--routes', type=int, default=50)
+    parser.add_argument('--lookups', type=int, default=20000)
+    args = parser.parse_args()
+
+    routes = [f'/bench/page_{i}' for i in range(args.routes)]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        store = PageConfStore(Path(tmp_dir) / 'pageconf.sqlite3')
+
+        start = time.perf_counter()
+        for user in range(args.users):
+            # Every user overrides a few routes
+            for route in random.sample(routes, 5):
+                store.save(f'user{user}', route, {'cards_per_row': 4, 'card_height': 300})
+        saves = args.users * 5
+        save_us = (time.perf_counter() - start) / saves * 1e6
+
+        start = time.perf_counter()
+        for _ in range(args.lookups):
+            store.layers(f'user{random.randrange(args.users)}', random.choice(routes))
+        lookup_us = (time.perf_counter() - start) / args.lookups * 1e6
+        store.close()
+
+    print(f'{saves} rows ({args.users} users x 5 of {args.routes} routes)')
+    print(f'save:   {save_us:8.2f} us/row')
+    print(f'lookup: {lookup_us:8.2f} us/layers() call')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+"""
+Compare page discovery with a full os.walk scan against the on-disk page index.
+
+Usage:
+    python utils/pageindex_benchmark.py [--sizes 1000 10000] [--per-folder 50]
+"""
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.common.synthetic import timed
+from web.components.pagemanager import PageManager
+
+
+def generate_pages(root: Path, count: int, per_folder: int) -> Path:
+    """Create web/pages/folder_<n>/page_<i>_page.py files under root"""
+    pages_dir = root / 'web' / 'pages'
+    for i in range(count):
+        folder = pages_dir / f'folder_{i // per_folder}'
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / f'generated_{i}_page.py').write_text(f'class Generated{i}Page:\n    pass\n')
+    return pages_dir
+
+
+def run(count: int, per_folder: int):
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        pages_dir = generate_pages(root, count, per_folder)
+        index_file = root / 'pageindex.json'
+
+        _, scan_seconds = timed(PageManager(pages_dir=pages_dir, index_file=None)._scan_pages)
+        _, build_seconds = timed(PageManager(pages_dir=pages_dir, index_file=index_file)._load_pages)
+        warm = PageManager(pages_dir=pages_dir, index_file=index_file)
+        _, warm_seconds = timed(warm._load_pages)
+
+        # One added and one deleted file in different folders
+        (pages_dir / 'folder_0' / 'added_page.py').write_text('class AddedPage:\n    pass\n')
+        (pages_dir / 'folder_1' / f'generated_{per_folder}_page.py').unlink()
+        changed = PageManager(pages_dir=pages_dir, index_file=index_file)
+        pages, changed_seconds = timed(changed._load_pages)
+        assert pages == PageManager(pages_dir=pages_dir, index_file=None)._scan_pages()
+
+        print(f'{count:>7} pages | cold scan {scan_seconds * 1000:8.1f} ms | '
+              f'index build {build_seconds * 1000:8.1f} ms | warm index {warm_seconds * 1000:8.1f} ms | '
+              f'warm + 2 changes {changed_seconds * 1000:8.1f} ms '
+              f'(index {index_file.stat().st_size / 1024:.0f} KiB, {changed.pageindex.stats})')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--per-folder', type=int, default=50)
+    args = parser.parse_args()
+
+    for count in args.sizes:
+        run(count, args.per_folder)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+SearchIndex vs scanning lowercased columns on every query (what the cards pages did).
+
+Both must return the same rows, the script exits with status 1 otherwise.
+
+Usage:
+    python utils/searchindex_benchmark.py [--rows 1000000] [--queries "card 12345" 99 "description 9"]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+import polars as pl
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.common.synthetic import cards_frame, timed
+from web.components.searchindex import SearchIndex
+
+COLUMNS = ['name', 'description']
+
+
+def scan(df: pl.DataFrame, text: str) -> pl.Series:
+    text = text.lower()
+    return df.with_row_index('row').filter(
+        pl.col('name').str.to_lowercase().str.contains(text, literal=True) |
+        pl.col('description').str.to_lowercase().str.contains(text, literal=True)
+    )['row']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--queries', nargs='+', default=['card 12345', '99', 'description 99', 'zzz', 'CARD 5'])
+    args = parser.parse_args()
+
+    df = cards_frame(args.rows).select(COLUMNS)
+    index, seconds = timed(SearchIndex, df, COLUMNS)
+    print(f"build: {seconds * 1000:.0f} ms for {args.rows:,} rows")
+
+    appended = cards_frame(1000).select(COLUMNS).with_columns(pl.col('name') + ' appended')
+    _, seconds = timed(index.append, appended)
+    print(f"append: {seconds * 1000:.1f} ms for {appended.height:,} rows")
+    df = pl.concat([df, appended])
+
+    failed = False
+    print(f"{'query':<18} {'rows':>9} {'scan ms':>9} {'index ms':>9}")
+    for query in args.queries:
+        expected, scan_seconds = timed(scan, df, query)
+        found, index_seconds = timed(index.search, query)
+        if found.to_list() != expected.to_list():
+            failed = True
+            print(f"MISMATCH for {query!r}: {found.len()} rows found, {expected.len()} expected")
+        print(f"{query!r:<18} {found.len():>9,} {scan_seconds * 1000:>9.1f} {index_seconds * 1000:>9.2f}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Measure the time from process start to the first served page.
+
+Usage:
+    python utils/startup_time.py [--route /cards/cards_polars] [--port 8000] [--runs 3]
+"""
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+def wait_for_page(url: str, timeout: float) -> bool:
+    """Poll the url until it answers with HTTP 200 or the timeout expires"""
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as response:
+                if response.status == 200:
+                    response.read()
+                    return True
+        except OSError:
+            pass
+        time.sleep(0.05)
+    return False
+
+
+def port_in_use(port: int) -> bool:
+    """True if something already listens on the port, it would answer instead of the measured server"""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        return sock.connect_ex(('localhost', port)) == 0
+
+
+def measure(route: str, port: int, timeout: float) -> float:
+    """Start web/app.py on the port and return the seconds until the route is served"""
+    if port_in_use(port):
+        raise RuntimeError(f'port {port} is already in use, stop that server or pass another --port')
+    url = f'http://localhost:{port}{route}'
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, 'web/app.py'],
+        cwd=PROJECT_ROOT,
+        env={**os.environ, 'DASHBOARD_PORT': str(port)},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    try:
+        if not wait_for_page(url, timeout):
+            raise TimeoutError(f'{url} not served within {timeout}s')
+        return time.perf_counter() - start
+    finally:
+        process.terminate()
+        process.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--route', default='/examples/example')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--timeout', type=float, default=60)
+    args = parser.parse_args()
+
+    timings = []
+    for run in range(1, args.runs + 1):
+        elapsed = measure(args.route, args.port, args.timeout)
+        timings.append(elapsed)
+        print(f'run {run}: {elapsed * 1000:.0f} ms')
+
+    print(f'first page {args.route}: min {min(timings) * 1000:.0f} ms, '
+          f'avg {sum(timings) / len(timings) * 1000:.0f} ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+Download Apache Arrow JS into web/static/arrow, so AgGridPolars(transfer='arrow') serves it from /static
+instead of the CDN (offline, air-gapped and CSP-restricted deployments). Commit the downloaded files.
+
+Usage:
+    python utils/vendor_arrow_js.py [--version 17.0.0]
+"""
+import argparse
+import sys
+import urllib.request
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from web.components.aggrid_polars import ARROW_JS_FILE, ARROW_JS_VERSION
+
+PACKAGE_URL = 'https://cdn.jsdelivr.net/npm/apache-arrow@{version}/{name}'
+# The bundle is required, the Apache-2.0 license and notice ship next to it
+FILES = (ARROW_JS_FILE.name, 'LICENSE.txt', 'NOTICE.txt')
+
+
+def download(version: str, name: str) -> bytes:
+    with urllib.request.urlopen(PACKAGE_URL.format(version=version, name=name), timeout=60) as response:
+        return response.read()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--version', default=ARROW_JS_VERSION,
+                        help='keep it equal to ARROW_JS_VERSION in web/components/aggrid_polars.py')
+    args = parser.parse_args()
+
+    files = {name: download(args.version, name) for name in FILES}
+    if b'tableFromIPC' not in files[ARROW_JS_FILE.name]:
+        sys.exit(f"{ARROW_JS_FILE.name} {args.version} does not define tableFromIPC, not written")
+
+    ARROW_JS_FILE.parent.mkdir(parents=True, exist_ok=True)
+    for name, content in files.items():
+        (ARROW_JS_FILE.parent / name).write_bytes(content)
+        print(f"{ARROW_JS_FILE.parent / name}: {len(content) / 1024:.0f} KiB")
+
+
+if __name__ == '__main__':
+    main()
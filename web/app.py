@@ -1,12 +1,20 @@
+import os
 import sys
+
+if os.getenv('DASHBOARD_PROFILE_IMPORTS'):
+    # Must run before the project modules are imported
+    from web.components.moduleprofiler import moduleprofiler
+    moduleprofiler.install(trace_memory=os.getenv('DASHBOARD_PROFILE_IMPORTS') == 'memory')
+
 from nicegui import ui
 from webapp import webapp, webapp_shutdown
 
 
 return_code = 1
 try:
-    webapp()
-    ui.run(dark=True, port=8000, reload=False, favicon='🆖', title="dashboard")
+    webapp(pageconf_db=os.getenv('DASHBOARD_PAGECONF_DB'))
+    ui.run(dark=True, port=int(os.getenv('DASHBOARD_PORT', 8000)), reload=False, favicon='🆖', title="dashboard",
+           storage_secret=os.getenv('DASHBOARD_STORAGE_SECRET'))
 except KeyboardInterrupt:
     print('SIGINT received, aborting')
     webapp_shutdown()
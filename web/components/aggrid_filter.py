@@ -0,0 +1,161 @@
+from datetime import date
+from typing import Any, List, Optional, TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+def _text_condition(column: str, condition: dict) -> Optional['pl.Expr']:
+    """AG Grid text filter condition, case-insensitive like the browser filter"""
+    import polars as pl
+
+    col = pl.col(column).cast(pl.String).str.to_lowercase()
+    value = str(condition.get('filter') or '').lower()
+    operation = condition.get('type')
+    if operation == 'contains':
+        return col.str.contains(value, literal=True)
+    # Like the browser text filter, the negative operations keep blank cells
+    if operation == 'notContains':
+        return ~col.str.contains(value, literal=True) | col.is_null()
+    if operation == 'equals':
+        return col == value
+    if operation == 'notEqual':
+        return (col != value) | col.is_null()
+    if operation == 'startsWith':
+        return col.str.starts_with(value)
+    if operation == 'endsWith':
+        return col.str.ends_with(value)
+    if operation == 'blank':
+        return col.is_null() | (col == '')
+    if operation == 'notBlank':
+        return col.is_not_null() & (col != '')
+    logger.warning(f"Unsupported text filter '{operation}' on '{column}' ignored")
+    return None
+
+
+def _compare(col: 'pl.Expr', operation: str, value: Any, value_to: Any) -> Optional['pl.Expr']:
+    """Comparison operations shared by the number and date filters"""
+    import polars as pl
+
+    if operation == 'blank':
+        return col.is_null()
+    if operation == 'notBlank':
+        return col.is_not_null()
+    if value is None or (operation == 'inRange' and value_to is None):
+        # Incomplete condition, AG Grid does not apply it either
+        return pl.lit(True)
+    if operation == 'equals':
+        return col == value
+    if operation == 'notEqual':
+        return col != value
+    if operation == 'greaterThan':
+        return col > value
+    if operation == 'greaterThanOrEqual':
+        return col >= value
+    if operation == 'lessThan':
+        return col < value
+    if operation == 'lessThanOrEqual':
+        return col <= value
+    if operation == 'inRange':
+        # AG Grid excludes both bounds unless inRangeInclusive is set
+        return (col > value) & (col < value_to)
+    return None
+
+
+def _number_condition(column: str, condition: dict) -> Optional['pl.Expr']:
+    import polars as pl
+
+    expr = _compare(pl.col(column), condition.get('type'), condition.get('filter'), condition.get('filterTo'))
+    if expr is None:
+        logger.warning(f"Unsupported number filter '{condition.get('type')}' on '{column}' ignored")
+    return expr
+
+
+def _parse_date(value: Optional[str]) -> Optional[date]:
+    """AG Grid sends dates as 'YYYY-MM-DD hh:mm:ss'"""
+    return date.fromisoformat(value[:10]) if value else None
+
+
+def _date_condition(column: str, condition: dict) -> Optional['pl.Expr']:
+    import polars as pl
+
+    # Dates are compared by day, Datetime columns are truncated to their date
+    col = pl.col(column).cast(pl.Date)
+    expr = _compare(col, condition.get('type'), _parse_date(condition.get('dateFrom')),
+                    _parse_date(condition.get('dateTo')))
+    if expr is None:
+        logger.warning(f"Unsupported date filter '{condition.get('type')}' on '{column}' ignored")
+    return expr
+
+
+def _set_condition(column: str, model: dict) -> 'pl.Expr':
+    """Set filter: values are the displayed keys as strings, None selects blanks"""
+    import polars as pl
+
+    values = model.get('values') or []
+    col = pl.col(column).cast(pl.String)
+    expr = col.is_in([value for value in values if value is not None])
+    if None in values:
+        expr = expr | col.is_null()
+    return expr
+
+
+CONDITION_BUILDERS = {
+    'text': _text_condition,
+    'number': _number_condition,
+    'date': _date_condition,
+    'set': _set_condition,
+}
+
+
+def _column_expression(column: str, model: dict) -> Optional['pl.Expr']:
+    """Filter model of one column, with or without combined conditions"""
+    builder = CONDITION_BUILDERS.get(model.get('filterType'))
+    if builder is None:
+        logger.warning(f"Unsupported filter type '{model.get('filterType')}' on '{column}' ignored")
+        return None
+
+    if 'conditions' not in model:
+        return builder(column, model)
+    expressions = [expr for expr in (builder(column, condition) for condition in model['conditions'])
+                   if expr is not None]
+    if not expressions:
+        return None
+    combined = expressions[0]
+    for expr in expressions[1:]:
+        combined = combined | expr if model.get('operator') == 'OR' else combined & expr
+    return combined
+
+
+def filter_expression(filter_model: Optional[dict], columns: List[str]) -> Optional['pl.Expr']:
+    """AND of the column filters of an AG Grid filterModel, None when nothing filters"""
+    expressions = []
+    for column, model in (filter_model or {}).items():
+        if column not in columns:
+            logger.warning(f"Filter on unknown column '{column}' ignored")
+            continue
+        expr = _column_expression(column, model)
+        if expr is not None:
+            expressions.append(expr)
+    if not expressions:
+        return None
+    combined = expressions[0]
+    for expr in expressions[1:]:
+        combined = combined & expr
+    return combined
+
+
+def apply_models(df: 'pl.DataFrame', sort_model: Optional[list] = None,
+                 filter_model: Optional[dict] = None) -> 'pl.DataFrame':
+    """Filter then sort a frame with the AG Grid filterModel and sortModel"""
+    expr = filter_expression(filter_model, df.columns)
+    if expr is not None:
+        df = df.filter(expr)
+    sort_model = [item for item in (sort_model or []) if item.get('colId') in df.columns]
+    if sort_model:
+        df = df.sort([item['colId'] for item in sort_model],
+                     descending=[item.get('sort') == 'desc' for item in sort_model],
+                     nulls_last=True, maintain_order=True)
+    return df
@@ -1,22 +1,112 @@
-from typing import Optional, Dict, Set, Any, Callable
-import polars as pl
+import json
+import os
+import uuid
+import weakref
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional, Dict, List, Set, Any, Callable, Tuple, TYPE_CHECKING
+from loguru import logger
 from nicegui import ui
+from nicegui.events import GenericEventArguments
+
+from web.components.aggrid_filter import apply_models
+from web.components.arrow_transfer import to_arrow_ipc
+from web.components.keyindex import KeyIndex
+from web.components.searchindex import SearchIndex, search_key
+
+if TYPE_CHECKING:
+    import polars as pl
+
+# Apache Arrow JS decoding the 'arrow' transfer in the browser, vendored by utils/vendor_arrow_js.py.
+# Without the vendored file the CDN is only used when DASHBOARD_ARROW_JS_CDN=1 opts in.
+ARROW_JS_VERSION = '17.0.0'
+ARROW_JS_FILE = Path(__file__).resolve().parent.parent / 'static' / 'arrow' / 'Arrow.es2015.min.js'
+ARROW_JS_URL = '/static/arrow/Arrow.es2015.min.js'
+ARROW_JS_CDN_URL = f'https://cdn.jsdelivr.net/npm/apache-arrow@{ARROW_JS_VERSION}/Arrow.es2015.min.js'
+
+# Hidden row field holding the lowercased quick search columns
+SEARCH_KEY_FIELD = '__search_key'
+
+# Grids fetching their rows from the /aggrid/{grid_id}/... endpoints (kept across module reloads)
+_served_grids: 'weakref.WeakValueDictionary[str, AgGridPolars]' = \
+    globals().get('_served_grids') or weakref.WeakValueDictionary()
+
+
+# The grid helpers go into the shared head once per process: a grid built after the socket connected
+# (progressive pages) can no longer add scripts, head HTML is then inserted without running them.
+# The Arrow JS bundle itself is only fetched by loadArrowRows, on pages showing an 'arrow' grid.
+if not globals().get('_scripts_added'):
+    ui.add_head_html('''
+        <script src="/static/aggrid_selection.js"></script>
+        <script src="/static/aggrid_quicksearch.js"></script>
+        <script src="/static/aggrid_arrow.js"></script>
+    ''', shared=True)
+    _scripts_added = True
+
+
+@lru_cache(maxsize=1)
+def arrow_js_url() -> Optional[str]:
+    """The vendored Arrow JS, the CDN if opted in, else None. Decided (and logged) once per process."""
+    if ARROW_JS_FILE.exists():
+        return ARROW_JS_URL
+    if os.getenv('DASHBOARD_ARROW_JS_CDN') == '1':
+        logger.info(f"{ARROW_JS_FILE} missing, loading Arrow JS from {ARROW_JS_CDN_URL} (DASHBOARD_ARROW_JS_CDN=1)")
+        return ARROW_JS_CDN_URL
+    logger.warning(f"{ARROW_JS_FILE} missing, transfer='arrow' grids send JSON rowData: "
+                   f"run python utils/vendor_arrow_js.py, or set DASHBOARD_ARROW_JS_CDN=1 to use {ARROW_JS_CDN_URL}")
+    return None
 
 
 class AgGridPolars:
+    """
+    AG Grid over a Polars DataFrame.
+
+    row_model='client' sends the whole frame as rowData.
+    row_model='infinite' lets the grid fetch blocks of block_size rows by index range,
+    sorted and filtered in Polars, so only the visible blocks reach the browser.
+    transfer='arrow' (client row model) fetches the rows as an Arrow IPC stream instead of JSON rowData.
+    quick_search_columns (client row model) enables quick_search(), filtering in the browser
+    with AG Grid's external filter on a precomputed search key, the rowData is never resent.
+    search_index (infinite row model) makes search() select the rows with a SearchIndex on the server.
+    Selection changes are diffed in the browser, the server only receives the added and removed row ids.
+    """
+
     def __init__(self,
-                 df: pl.DataFrame,
+                 df: 'pl.DataFrame',
                  checkbox_field: str,
                  grid_height: int,
                  on_selection_change: Callable,
-                 theme: str = 'balham-dark'):
+                 theme: str = 'balham-dark',
+                 row_model: str = 'client',
+                 block_size: int = 100,
+                 transfer: str = 'json',
+                 quick_search_columns: Optional[List[str]] = None,
+                 search_index: Optional[SearchIndex] = None):
         self.df = df
         self.checkbox_field = checkbox_field
         self.grid_height = grid_height
         self.on_selection_change = on_selection_change
         self.theme = theme
+        self.row_model = row_model
+        self.block_size = block_size
+        # Without Arrow JS to decode it the 'arrow' transfer falls back to JSON rowData
+        self.transfer = 'json' if transfer == 'arrow' and arrow_js_url() is None else transfer
+        self.quick_search_columns = quick_search_columns if row_model == 'client' else None
+        self.search_index = search_index if row_model == 'infinite' else None
+        self._key_index: Optional[KeyIndex] = None
+        # (search text, row positions found by the search index or None for all rows)
+        self._search: Tuple[str, Optional['pl.Series']] = ('', None)
+        self.grid_id = uuid.uuid4().hex
         self.ui_grid: Optional[ui.aggrid] = None
         self.selected_items: Set[str] = set()
+        # (sort and filter model key, sorted and filtered frame) of the last block request
+        self._view: Tuple[Optional[str], Optional['pl.DataFrame']] = (None, None)
+        if row_model == 'infinite' or self.transfer == 'arrow':
+            _served_grids[self.grid_id] = self
+
+    @staticmethod
+    def get(grid_id: str) -> Optional['AgGridPolars']:
+        return _served_grids.get(grid_id)
 
     def create_grid(self) -> ui.aggrid:
         """Create and configure the AG Grid component"""
@@ -30,17 +120,100 @@ class AgGridPolars:
             'rowSelection': 'multiple',
             'rowMultiSelectWithClick': True,
             ':getRowId': f'(params) => params.data.{self.checkbox_field}',
-            'rowData': self.df.to_dicts(),
-            'suppressFieldDotNotation': True
+            'suppressFieldDotNotation': True,
+            ':onSelectionChanged': f'(params) => emitSelectionDelta(params.api, {json.dumps(self.grid_id)}, '
+                                   f'{json.dumps(self.checkbox_field)})'
         }
+        if self.row_model == 'infinite':
+            grid_config.update({
+                'rowModelType': 'infinite',
+                'cacheBlockSize': self.block_size,
+                ':datasource': self._datasource(),
+            })
+        elif self.transfer == 'arrow':
+            grid_config[':onGridReady'] = \
+                f"(params) => loadArrowRows(params.api, '/aggrid/{self.grid_id}/arrow', '{arrow_js_url()}')"
+        else:
+            grid_config['rowData'] = self._row_frame().to_dicts()
+
+        if self.quick_search_columns:
+            grid_id = json.dumps(self.grid_id)
+            grid_config[':isExternalFilterPresent'] = f'() => !!aggridQuickSearch[{grid_id}]'
+            grid_config[':doesExternalFilterPass'] = \
+                f'(node) => node.data.{SEARCH_KEY_FIELD}.includes(aggridQuickSearch[{grid_id}])'
 
         self.ui_grid = ui.aggrid(grid_config, theme=self.theme).classes('w-full') \
             .style(f'height: {self.grid_height}px')
-        self.ui_grid.on('selectionChanged', self.handle_selection_change)
+        ui.on(f'aggrid_selection_{self.grid_id}', self.handle_selection_change)
         return self.ui_grid
 
+    @property
+    def key_index(self) -> KeyIndex:
+        """checkbox_field -> row position, built on first use and again if df was replaced"""
+        if self._key_index is None or self._key_index.df is not self.df:
+            self._key_index = KeyIndex(self.df, self.checkbox_field)
+        return self._key_index
+
+    def rows_by_key(self, keys) -> Dict[Any, dict]:
+        """{row id: row dict} of the given row ids (e.g. a selection delta), in one batch"""
+        return self.key_index.dicts(keys)
+
+    def _datasource(self) -> str:
+        """Infinite row model datasource fetching row blocks from the server"""
+        return f'''({{
+            getRows: (params) => fetch('/aggrid/{self.grid_id}/rows', {{
+                method: 'POST',
+                headers: {{'Content-Type': 'application/json'}},
+                body: JSON.stringify({{
+                    startRow: params.startRow, endRow: params.endRow,
+                    sortModel: params.sortModel, filterModel: params.filterModel
+                }})
+            }}).then((response) => response.json())
+              .then((data) => params.successCallback(data.rows, data.lastRow))
+              .catch(() => params.failCallback())
+        }})'''
+
+    def get_rows(self, start_row: int, end_row: int, sort_model: Optional[list] = None,
+                 filter_model: Optional[dict] = None) -> Tuple['pl.DataFrame', int]:
+        """Rows [start_row, end_row) of the sorted and filtered frame (a zero-copy slice) and its row count"""
+        search_text, search_rows = self._search
+        key = json.dumps([search_text, sort_model, filter_model], sort_keys=True)
+        view_key, view = self._view
+        if view_key != key:
+            # Scrolling requests further blocks of the same view, sort and filter once per model change
+            df = self.df if search_rows is None else self.df[search_rows]
+            view = apply_models(df, sort_model, filter_model)
+            self._view = (key, view)
+        return view.slice(start_row, max(end_row - start_row, 0)), view.height
+
+    def rows_json(self, request: Dict[str, Any]) -> str:
+        """Answer an infinite row model block request, {"rows": [...], "lastRow": n}"""
+        rows, last_row = self.get_rows(int(request.get('startRow', 0)),
+                                       int(request.get('endRow', self.block_size)),
+                                       request.get('sortModel'),
+                                       request.get('filterModel'))
+        return f'{{"rows":{rows.write_json()},"lastRow":{last_row}}}'
+
+    def arrow_ipc(self) -> bytes:
+        """The frame as an Arrow IPC stream for static/aggrid_arrow.js"""
+        return to_arrow_ipc(self._row_frame())
+
+    def _row_frame(self) -> 'pl.DataFrame':
+        """The frame sent to the browser, with the quick search key when enabled"""
+        if not self.quick_search_columns:
+            return self.df
+        return self.df.with_columns(search_key(self.quick_search_columns).alias(SEARCH_KEY_FIELD))
+
+    def set_height(self, grid_height: int):
+        """Change the grid height in place"""
+        self.grid_height = grid_height
+        if self.ui_grid:
+            self.ui_grid.style(f'height: {grid_height}px')
+
     def map_polars_aggrid_schema(self) -> list:
         """Map Polars schema to AG Grid column definitions"""
+        import polars as pl
+
         column_defs = []
 
         # Add checkbox column
@@ -48,7 +221,8 @@ class AgGridPolars:
             column_defs.append({
                 'field': self.checkbox_field,
                 'checkboxSelection': True,
-                'headerCheckboxSelection': True,
+                # Select all is not available with the infinite row model
+                'headerCheckboxSelection': self.row_model == 'client',
                 # 'headerCheckboxSelectionFilteredOnly': True,
                 # 'width': 50
             })
@@ -75,25 +249,23 @@ class AgGridPolars:
 
         return column_defs
 
-    async def handle_selection_change(self, _):
-        """Process grid selection changes"""
-        if self.ui_grid:
-            selected_rows = await self.ui_grid.get_selected_rows()
-            newly_selected = {row[self.checkbox_field] for row in selected_rows}
-
-            # Call the provided callback with selection changes
-            await self.on_selection_change(
-                removed=self.selected_items - newly_selected,
-                added=newly_selected - self.selected_items
-            )
-
-            self.selected_items = newly_selected
+    async def handle_selection_change(self, e: GenericEventArguments):
+        """Forward the {added, removed} row ids computed by the browser"""
+        added, removed = set(e.args['added']), set(e.args['removed'])
+        self.selected_items = (self.selected_items - removed) | added
+        await self.on_selection_change(removed=removed, added=added)
 
     async def search(self, search_text: str):
         """Apply search filter to the grid"""
         if not self.ui_grid:
             return
 
+        if self.search_index is not None:
+            # The grid fetches its blocks again, from the rows found by the index
+            self._search = (search_text or '', self.search_index.search(search_text) if search_text else None)
+            self.ui_grid.run_grid_method('purgeInfiniteCache')
+            return
+
         if search_text:
             await self.ui_grid.run_grid_method('setFilterModel', {
                 self.checkbox_field: {
@@ -104,6 +276,13 @@ class AgGridPolars:
         else:
             await self.ui_grid.run_grid_method('setFilterModel', None)
 
+    def quick_search(self, search_text: Optional[str]):
+        """Filter the rows in the browser, only the search text is sent (debounce the input calling this)"""
+        if not self.ui_grid or not self.quick_search_columns:
+            return
+        ui.run_javascript(f'aggridQuickSearch[{json.dumps(self.grid_id)}] = {json.dumps((search_text or "").lower())}')
+        self.ui_grid.run_grid_method('onFilterChanged')
+
     async def deselect_row(self, row_id: str):
         """Deselect a specific row by ID"""
         if self.ui_grid:
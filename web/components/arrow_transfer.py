@@ -0,0 +1,26 @@
+import io
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+def to_arrow_ipc(df: 'pl.DataFrame', compression: str = 'uncompressed') -> bytes:
+    """
+    Serialize a frame as an Arrow IPC stream with types Arrow JS decodes into plain values:
+    64-bit integers as doubles (not BigInt), durations as milliseconds (doubles)
+    and the other temporal columns except Date as ISO strings.
+    Dates stay 4-byte date32 and are formatted in the browser (static/aggrid_arrow.js).
+    Arrow JS cannot decompress IPC buffers, browsers get 'uncompressed' with an HTTP Content-Encoding instead.
+    """
+    import polars as pl
+    import polars.selectors as cs
+
+    # Duration has no string cast
+    df = df.with_columns((cs.temporal() - cs.date() - cs.duration()).cast(pl.String),
+                         cs.duration().dt.total_milliseconds().cast(pl.Float64),
+                         cs.by_dtype(pl.Int64, pl.UInt64).cast(pl.Float64))
+    buffer = io.BytesIO()
+    # Oldest compat level writes large_string instead of string_view, which Arrow JS cannot read
+    df.write_ipc_stream(buffer, compression=compression, compat_level=pl.CompatLevel.oldest())
+    return buffer.getvalue()
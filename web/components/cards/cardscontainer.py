@@ -52,6 +52,16 @@ class CardContainer(ui.grid):
             card.delete()
         self.ui_cards.clear()
 
+    def set_columns(self, columns: int) -> None:
+        """Change the number of cards per row in place"""
+        self.style(f'grid-template-columns: repeat({columns}, minmax(0, 1fr))')
+
+    def set_card_height(self, card_height: int) -> None:
+        """Change the height of all cards in place"""
+        self.card_height = card_height
+        for card in self.ui_cards.values():
+            card.style(f'height: {card_height}px;')
+
     def reorder_cards(self, dragged_card: CardTemplate, target_card: CardTemplate, position: str = 'left') -> None:
         """Reorder cards by moving their DOM elements instead of rebuilding"""
         dragged_name = dragged_card.name
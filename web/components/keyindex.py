@@ -0,0 +1,36 @@
+from typing import Any, Dict, Iterable, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+class KeyIndex:
+    """
+    Hash index from a unique key column (the grid row id) to the row position.
+    Looking up many keys is one dict pass and one vectorized gather, instead of a column scan per key.
+    """
+
+    def __init__(self, df: 'pl.DataFrame', key: str):
+        self.df = df
+        self.key = key
+        self.positions: Dict[Any, int] = {value: position for position, value in enumerate(df[key].to_list())}
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __contains__(self, value) -> bool:
+        return value in self.positions
+
+    def positions_of(self, keys: Iterable) -> List[int]:
+        """Row positions of the keys present in the frame, in the order given"""
+        positions = self.positions
+        return [positions[value] for value in keys if value in positions]
+
+    def rows(self, keys: Iterable) -> 'pl.DataFrame':
+        """The rows of the keys, gathered in one take"""
+        return self.df[self.positions_of(keys)]
+
+    def dicts(self, keys: Iterable) -> Dict[Any, dict]:
+        """{key: row dict} of the keys, converted in a single batch"""
+        rows = self.rows(keys)
+        return dict(zip(rows[self.key].to_list(), rows.to_dicts()))
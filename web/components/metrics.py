@@ -0,0 +1,71 @@
+from bisect import bisect_left
+from typing import Dict, Tuple
+
+# Upper bounds in seconds, Prometheus default buckets
+BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram, cheap enough to observe on every render"""
+    __slots__ = ('counts', 'sum', 'count')
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, seconds: float):
+        self.counts[bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+
+
+class RenderMetrics:
+    """Page render phase timings keyed by (route, page class, phase)"""
+
+    def __init__(self, name: str = 'dashboard_render_phase_seconds'):
+        self.name = name
+        self._histograms: Dict[Tuple[str, str, str], Histogram] = {}
+
+    def observe(self, route: str, page: str, phase: str, seconds: float):
+        key = (route, page, phase)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = Histogram()
+        histogram.observe(seconds)
+
+    def clear(self):
+        self._histograms.clear()
+
+    def to_prometheus(self) -> str:
+        """Render all histograms in the Prometheus text exposition format"""
+        lines = [
+            f'# HELP {self.name} Duration of PageTemplate.render phases.',
+            f'# TYPE {self.name} histogram'
+        ]
+        for (route, page, phase), histogram in sorted(self._histograms.items()):
+            labels = f'route="{route}",page="{page}",phase="{phase}"'
+            cumulative = 0
+            for bound, count in zip(BUCKETS, histogram.counts):
+                cumulative += count
+                lines.append(f'{self.name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{self.name}_bucket{{{labels},le="+Inf"}} {histogram.count}')
+            lines.append(f'{self.name}_sum{{{labels}}} {histogram.sum}')
+            lines.append(f'{self.name}_count{{{labels}}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+
+def dispatch_to_prometheus(timings: Dict[str, dict], name: str = 'dashboard_dispatch_seconds') -> str:
+    """Render RouteTable.get_timings() as a Prometheus summary without quantiles"""
+    lines = [
+        f'# HELP {name} Duration of route dispatch phases.',
+        f'# TYPE {name} summary'
+    ]
+    for phase, stats in sorted(timings.items()):
+        lines.append(f'{name}_sum{{phase="{phase}"}} {stats["total_ms"] / 1000}')
+        lines.append(f'{name}_count{{phase="{phase}"}} {stats["count"]}')
+    return '\n'.join(lines) + '\n'
+
+
+# Global instance
+rendermetrics = RenderMetrics()
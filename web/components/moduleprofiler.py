@@ -0,0 +1,134 @@
+import importlib.abc
+import importlib.machinery
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional
+
+from loguru import logger
+
+PROJECT_ROOT = str(Path(__file__).resolve().parent.parent.parent)
+VENV_PATH = os.getenv("VIRTUAL_ENV", sys.prefix)
+
+
+@dataclass
+class ModuleStats:
+    """Measured costs of one project module"""
+    import_time: Optional[float] = None  # seconds, nested project imports excluded
+    memory: Optional[int] = None  # bytes still allocated after the import, nested imports excluded
+    reload_count: int = 0
+    last_reload: Optional[float] = None  # seconds
+
+
+class _ProfilingLoader(importlib.abc.Loader):
+    """Delegates to the real loader and measures exec_module"""
+
+    def __init__(self, loader, profiler: 'ModuleProfiler'):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        with self._profiler.measure(module.__name__):
+            self._loader.exec_module(module)
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+
+class _ProfilingFinder(importlib.abc.MetaPathFinder):
+    """Finds project modules with the regular PathFinder and wraps their loader"""
+
+    def __init__(self, profiler: 'ModuleProfiler'):
+        self._profiler = profiler
+
+    def find_spec(self, fullname, path, target=None):
+        spec = importlib.machinery.PathFinder.find_spec(fullname, path, target)
+        if (spec is None or spec.origin is None or not spec.origin.startswith(PROJECT_ROOT)
+                or spec.origin.startswith(VENV_PATH) or not hasattr(spec.loader, 'exec_module')):
+            return None
+        spec.loader = _ProfilingLoader(spec.loader, self._profiler)
+        return spec
+
+
+class ModuleProfiler:
+    """
+    Import time, retained memory and reload statistics of project modules.
+
+    Import measurements come from an import hook that is only installed with install(),
+    otherwise the only cost is the reload bookkeeping done by ModuleReloader.
+    """
+
+    def __init__(self):
+        self.stats: Dict[str, ModuleStats] = {}
+        self.trace_memory = False
+        self._finder: Optional[_ProfilingFinder] = None
+        self._local = threading.local()
+
+    @property
+    def installed(self) -> bool:
+        return self._finder is not None
+
+    def install(self, trace_memory: bool = False):
+        """Install the import hook, call before the project modules are imported"""
+        if self._finder is not None:
+            return
+        self.trace_memory = trace_memory
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._finder = _ProfilingFinder(self)
+        sys.meta_path.insert(0, self._finder)
+        logger.info(f"Module import profiling enabled (memory: {trace_memory})")
+
+    def uninstall(self):
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+        if self.trace_memory:
+            tracemalloc.stop()
+            self.trace_memory = False
+
+    @contextmanager
+    def measure(self, name: str):
+        """Time a module execution, excluding nested project imports"""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        memory_start = tracemalloc.get_traced_memory()[0] if tracing else 0
+        stack.append([0.0, 0])  # time and memory of nested imports
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            memory = tracemalloc.get_traced_memory()[0] - memory_start if tracing else 0
+            nested_time, nested_memory = stack.pop()
+            if stack:
+                stack[-1][0] += elapsed
+                stack[-1][1] += memory
+            # Keep the first import, reloads are counted by record_reload
+            stats = self.stats.setdefault(name, ModuleStats())
+            if stats.import_time is None:
+                stats.import_time = elapsed - nested_time
+                if tracing:
+                    stats.memory = memory - nested_memory
+
+    def record_reload(self, name: str, seconds: float):
+        stats = self.stats.setdefault(name, ModuleStats())
+        stats.reload_count += 1
+        stats.last_reload = seconds
+
+    def get(self, name: str) -> ModuleStats:
+        return self.stats.get(name) or ModuleStats()
+
+
+# Global instance
+moduleprofiler = ModuleProfiler()
@@ -1,9 +1,32 @@
+import asyncio
 import os
 import sys
+import time
+import hashlib
 import importlib
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import ModuleType
+from typing import Dict, List, Set
 from loguru import logger
 
+from web.components.moduleprofiler import moduleprofiler
+
+# This module is never reloaded, so the lock is shared by every ModuleReloader instance
+reload_lock = asyncio.Lock()
+
+
+@dataclass
+class ReloadResult:
+    """Outcome of a reload: changed modules, reload seconds per module and skipped modules"""
+    changed: List[str] = field(default_factory=list)
+    reloaded: Dict[str, float] = field(default_factory=dict)
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+
+    def __len__(self):
+        return len(self.reloaded)
+
 
 class ModuleReloader:
     def __init__(self):
@@ -12,8 +35,54 @@ class ModuleReloader:
         """
         current_file = Path(__file__).resolve()
         self.project_root = current_file.parent.parent.parent
+        # Touched after every reload so other worker processes follow
+        self.reload_stamp = self.project_root / 'web' / '.reload_stamp'
+        self._stamp_seen = self._stamp_signature()
 
         self.modules_to_reload = set()
+        # Source file signatures, modules first seen later are compared with the reloader start time
+        self._started_ns = time.time_ns()
+        self._signatures: Dict[str, tuple] = {}
+        self._hashes: Dict[str, str] = {}
+
+    def _stamp_signature(self):
+        try:
+            return self.reload_stamp.stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def notify_workers(self):
+        """Signal other worker processes that project modules were reloaded"""
+        self.reload_stamp.touch()
+        self._stamp_seen = self._stamp_signature()
+
+    def is_notified(self) -> bool:
+        """True if another worker process reloaded project modules since the last check"""
+        return self._stamp_signature() != self._stamp_seen
+
+    def reload_if_notified(self):
+        """Reload project modules if another worker process reloaded them"""
+        if not self.is_notified():
+            return ReloadResult()
+        self._stamp_seen = self._stamp_signature()
+        logger.info("Reload requested by another worker")
+        return self.reload_project_modules()
+
+    async def reload_async(self, changed_only: bool = True) -> ReloadResult:
+        """Run reload_project_modules in a worker thread, one reload at a time"""
+        async with reload_lock:
+            return await asyncio.get_running_loop().run_in_executor(None, self.reload_project_modules, changed_only)
+
+    async def reload_if_notified_async(self) -> ReloadResult:
+        async with reload_lock:
+            return await asyncio.get_running_loop().run_in_executor(None, self.reload_if_notified)
+
+    @staticmethod
+    async def wait_for_reload():
+        """Wait until a running reload has finished"""
+        if reload_lock.locked():
+            async with reload_lock:
+                pass
 
     def get_project_modules(self):
         """
@@ -23,7 +92,7 @@ class ModuleReloader:
             list: List of project module names
         """
         project_root = Path(self.project_root).resolve()
-        venv_path = Path(os.getenv("VIRTUAL_ENV"))
+        venv_path = Path(os.getenv("VIRTUAL_ENV", sys.prefix))
         # venv_path = project_root / "venv"
 
         project_modules = []
@@ -47,35 +116,144 @@ class ModuleReloader:
 
         return project_modules
 
-    def reload_project_modules(self):
-        """Simple module reloader that skips __main__ and __mp_main__"""
+    def _reloadable_modules(self) -> Dict[str, Path]:
+        """Project modules that may be reloaded, with their resolved source path"""
+        modules = {}
+        for module in self.get_project_modules():
+            name = module['name']
+            # Skip the reloader itself, utils and the entry point
+            if (name in ('__main__', '__mp_main__', 'web.components.modulereloader', 'components.modulereloader',
+                         'web.components.moduleprofiler', 'components.moduleprofiler')
+                    or name.startswith('utils.')):
+                continue
+            modules[name] = (self.project_root / module['path']).resolve()
+        return modules
 
-        # Get modules and control reload order
-        self.modules_to_reload = list(module['name'] for module in self.get_project_modules())
+    @staticmethod
+    def _file_hash(path: Path) -> str:
+        return hashlib.sha1(path.read_bytes()).hexdigest()
 
-        # Remove modules we don't want to reload
-        if 'web.components.modulereloader' in self.modules_to_reload:
-            self.modules_to_reload.remove('web.components.modulereloader')
+    def _changed_files(self, paths: Set[Path]) -> Set[Path]:
+        """Source files changed since they were last seen: mtime/size first, content hash to confirm"""
+        changed = set()
+        for path in paths:
+            key = str(path)
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            signature = (stat.st_mtime_ns, stat.st_size)
+            previous = self._signatures.get(key)
+            if previous is None:
+                self._signatures[key] = signature
+                if stat.st_mtime_ns > self._started_ns:
+                    changed.add(path)
+                continue
+            if signature == previous:
+                continue
+            self._signatures[key] = signature
+            digest = self._file_hash(path)
+            if self._hashes.get(key) != digest:
+                self._hashes[key] = digest
+                changed.add(path)
+        return changed
+
+    @staticmethod
+    def _dependencies(module: ModuleType, names: Set[str]) -> Set[str]:
+        """Project modules referenced from a module namespace (import x / from x import y)"""
+        dependencies = set()
+        for value in list(vars(module).values()):
+            if isinstance(value, ModuleType):
+                name = value.__name__
+            else:
+                name = getattr(value, '__module__', None)
+            if name in names and name != module.__name__:
+                dependencies.add(name)
+        return dependencies
+
+    def _reload_order(self, modules: Dict[str, Path], changed: Set[str]) -> List[str]:
+        """Changed modules and everything depending on them, dependencies first"""
+        names = set(modules)
+        dependencies = {name: self._dependencies(sys.modules[name], names) for name in names}
+        dependents: Dict[str, Set[str]] = {name: set() for name in names}
+        for name, deps in dependencies.items():
+            for dep in deps:
+                dependents[dep].add(name)
 
-        self.modules_to_reload = [module for module in self.modules_to_reload if not module.startswith('utils.')]
+        selected = set(changed)
+        stack = list(changed)
+        while stack:
+            for dependent in dependents[stack.pop()]:
+                if dependent not in selected:
+                    selected.add(dependent)
+                    stack.append(dependent)
+
+        # Topological order (Kahn), cycles keep their sys.modules order
+        remaining = {name: dependencies[name] & selected for name in selected}
+        order = []
+        ready = [name for name in modules if name in remaining and not remaining[name]]
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            del remaining[name]
+            for dependent in dependents[name]:
+                if dependent in remaining:
+                    remaining[dependent].discard(name)
+                    if not remaining[dependent] and dependent not in ready:
+                        ready.append(dependent)
+        order.extend(name for name in modules if name in remaining)
 
         # Put webapp last
-        if 'web.webapp' in self.modules_to_reload:
-            self.modules_to_reload.remove('web.webapp')
-            self.modules_to_reload.append('web.webapp')
+        for webapp in ('web.webapp', 'webapp'):
+            if webapp in order:
+                order.remove(webapp)
+                order.append(webapp)
+        return order
 
-        modules_reloaded = []
+    def reload_project_modules(self, changed_only: bool = True) -> ReloadResult:
+        """
+        Reload changed project modules and their dependents in dependency order, then rescan the pages.
 
-        for module in self.modules_to_reload:
-            if module in ('__main__', '__mp_main__'):
-                continue
+        Args:
+            changed_only: False reloads every project module
+        """
+        modules = self._reloadable_modules()
+        changed_paths = self._changed_files(set(modules.values()))
+        if changed_only:
+            changed = {name for name, path in modules.items() if path in changed_paths}
+        else:
+            changed = set(modules)
 
+        self.modules_to_reload = self._reload_order(modules, changed) if changed else []
+        result = ReloadResult(
+            changed=sorted(changed),
+            skipped=sorted(set(modules) - set(self.modules_to_reload))
+        )
+
+        for module in self.modules_to_reload:
+            start = time.perf_counter()
             try:
                 importlib.reload(sys.modules[module])
-                modules_reloaded.append(module)
+                result.reloaded[module] = time.perf_counter() - start
+                moduleprofiler.record_reload(module, result.reloaded[module])
             except ModuleNotFoundError:
                 logger.debug(f"Module: '{module}' not found")
             except Exception as e:
+                result.failed[module] = str(e)
                 logger.error(f"Module: '{module}' can't be reloaded: {e}.")
 
-        return modules_reloaded
+        # Always drop the page list: a new page file is not a loaded module, so nothing above
+        # changed for it. The next get_pages() scans again (only changed folders through the page index)
+        # and the routes and menu follow the new generation. Import here to get the reloaded Registry.
+        from web.components.registry import Registry
+        Registry.clear()
+
+        logger.info(f"Reloaded {len(result.reloaded)} modules "
+                    f"({sum(result.reloaded.values()) * 1000:.0f} ms), skipped {len(result.skipped)}, "
+                    f"changed: {', '.join(result.changed) or '-'}")
+        return result
+
+
+# One reloader per process: its file signatures must outlive reloads of the modules using it (header),
+# a new instance would see every module as changed. This module is never reloaded, globals() guards re-imports.
+reloader: ModuleReloader = globals().get('reloader') or ModuleReloader()
@@ -1,13 +1,32 @@
+import asyncio
+import atexit
+import os
+import stat
+import tempfile
+import threading
+import time
+import weakref
 from pathlib import Path
+from types import MappingProxyType
 from loguru import logger
-from omegaconf import OmegaConf
-from nicegui import ui
-from typing import Callable
+from nicegui import app, ui
+from typing import Any, Callable, Dict, Mapping, NamedTuple, Optional, Tuple
 
 
 from utils.common.decorators import singleton
+from utils.common.filelock import FileLock
 
 PAGECONF_FILENAME = Path(__file__).parent.parent / "pageconf.yaml"
+PAGECONF_WRITE_DELAY = 0.5  # seconds without a change before pending changes are written
+PAGECONF_WRITE_MAX_DELAY = 5  # seconds, continuous changes are still written at least this often
+
+USER_CONF_CACHE_SIZE = 10000  # compiled (user, route) configurations kept in memory
+
+# Process umask, read once at import: os.umask() can only be read by setting it
+_UMASK = os.umask(0o022)
+os.umask(_UMASK)
+
+_DELETED = object()  # pending change marker for a deleted route
 
 # Simple default settings dict
 PAGECONF_DEFAULT = {
@@ -23,16 +42,182 @@ PAGECONF_DEFAULT = {
 }
 
 
+def _file_mode(path: Path) -> int:
+    """Permission bits of path, or those a new file gets under the process umask"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def _fsync_dir(path: Path):
+    """Persist a rename in the directory, where directories can be opened (not on Windows)"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class RouteConf(NamedTuple):
+    """Merged (default + route) configuration of one route, compiled once and immutable"""
+    route: str
+    sidebar_width: Optional[int]
+    sidebar_cards_grid_height: Optional[int]
+    cards_per_row: Optional[int]
+    card_height: Optional[int]
+    values: Mapping[str, Any]  # every merged key, read-only
+
+    @classmethod
+    def compile(cls, route: str, values: dict) -> 'RouteConf':
+        return cls(
+            route=route,
+            sidebar_width=values.get('sidebar_width'),
+            sidebar_cards_grid_height=values.get('sidebar_cards_grid_height'),
+            cards_per_row=values.get('cards_per_row'),
+            card_height=values.get('card_height'),
+            values=MappingProxyType(values)
+        )
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.values.get(key, default)
+
+
 @singleton
 class GlobalPageConf:
     """Singleton class for managing page configurations globally using NiceGUI dialog."""
 
     def __init__(self):
-        """Initialize configuration if not yet initialized."""
-        self.initialize_pageconf()
-        self._conf = OmegaConf.load(PAGECONF_FILENAME)
-        self._conf_default = self._conf.get("default", PAGECONF_DEFAULT)
+        """Configuration is loaded on first access to keep omegaconf out of startup."""
+        self._loaded_conf = None
+        self._loaded_conf_default = None
+        self._file_signature = None
+        # Changes applied in memory but not yet written: route -> conf or _DELETED
+        self._pending = {}
+        self._lock = threading.RLock()
+        self._flush_timer = None
+        self._flush_deadline = None  # monotonic time the pending changes are written by at the latest
+        self._compiled: Dict[str, RouteConf] = {}
+        # Live pages showing a route config, notified when it changes
+        self._pages = weakref.WeakSet()
+        # Optional per-user overrides (PageConfStore), layered over the YAML configuration
+        self.store = None
+        self._user_compiled: Dict[Tuple[str, str], Tuple[RouteConf, RouteConf]] = {}
+        atexit.register(self.flush)
+
+    @staticmethod
+    def _signature():
+        """(mtime, size) of the config file, changes when any worker process saves it"""
+        try:
+            stat = PAGECONF_FILENAME.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _apply_pending(self, conf):
+        for route, value in self._pending.items():
+            if value is _DELETED:
+                conf.pop(route, None)
+            else:
+                conf[route] = value
+
+    def _read(self):
+        """Load the file and re-apply changes not written yet"""
+        from omegaconf import OmegaConf
+        signature = self._signature()
+        conf = OmegaConf.load(PAGECONF_FILENAME)
+        with self._lock:
+            self._apply_pending(conf)
+            self._file_signature = signature
+            self._loaded_conf = conf
+            self._loaded_conf_default = conf.get("default", PAGECONF_DEFAULT)
+            self._compiled = {}
+
+    def _ensure_loaded(self):
+        """
+        Load or reload the file, takes FileLock and then self._lock (in _read):
+        never call it, or the _conf properties, while holding self._lock.
+        """
+        if self._loaded_conf is None:
+            self.initialize_pageconf()
+            self._read()
+        elif self._signature() != self._file_signature:
+            logger.debug(f"{PAGECONF_FILENAME} changed on disk, reloading")
+            with FileLock(PAGECONF_FILENAME):
+                self._read()
+
+    def _schedule_flush(self):
+        """Debounce: every change restarts the delay, up to PAGECONF_WRITE_MAX_DELAY after the first one"""
+        with self._lock:
+            now = time.monotonic()
+            if self._flush_timer is None:
+                self._flush_deadline = now + PAGECONF_WRITE_MAX_DELAY
+            else:
+                # A flush cancelling this timer writes the changes made before it, under the same lock
+                self._flush_timer.cancel()
+            self._flush_timer = threading.Timer(min(PAGECONF_WRITE_DELAY, max(self._flush_deadline - now, 0)),
+                                                self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
 
+    def flush(self):
+        """Write pending changes: merge into the current file under the lock, then atomically replace it."""
+        from omegaconf import OmegaConf
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending:
+                return
+            pending = dict(self._pending)
+
+        with FileLock(PAGECONF_FILENAME):
+            # Merge with edits other worker processes wrote in the meantime
+            conf = OmegaConf.load(PAGECONF_FILENAME) if PAGECONF_FILENAME.exists() else OmegaConf.create()
+            for route, value in pending.items():
+                if value is _DELETED:
+                    conf.pop(route, None)
+                else:
+                    conf[route] = value
+
+            fd, tmp_name = tempfile.mkstemp(dir=PAGECONF_FILENAME.parent, prefix='.pageconf.', suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(OmegaConf.to_yaml(conf))
+                    f.flush()
+                    os.fsync(f.fileno())
+                # mkstemp creates the file 0600, keep the mode of the file being replaced
+                os.chmod(tmp_name, _file_mode(PAGECONF_FILENAME))
+                os.replace(tmp_name, PAGECONF_FILENAME)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+            _fsync_dir(PAGECONF_FILENAME.parent)
+            signature = self._signature()
+
+        with self._lock:
+            # Drop what was written, keep changes made while writing
+            for route, value in pending.items():
+                if self._pending.get(route) is value:
+                    del self._pending[route]
+            self._apply_pending(conf)
+            self._file_signature = signature
+            self._loaded_conf = conf
+            self._loaded_conf_default = conf.get("default", PAGECONF_DEFAULT)
+            self._compiled = {}
+        logger.debug(f"Saved {len(pending)} route settings to {PAGECONF_FILENAME}")
+
+    @property
+    def _conf(self):
+        self._ensure_loaded()
+        return self._loaded_conf
+
+    @property
+    def _conf_default(self):
+        self._ensure_loaded()
+        return self._loaded_conf_default
 
     def show_notification(self, message: str, type: str = 'positive', duration: int = 5000):
         """Helper method to show notifications with consistent styling."""
@@ -57,24 +242,54 @@ class GlobalPageConf:
             return
 
         if pageconf_path.stat().st_size == 0:
+            from omegaconf import OmegaConf
             default_conf = OmegaConf.create({"default": PAGECONF_DEFAULT})
             OmegaConf.save(default_conf, PAGECONF_FILENAME)
             logger.info(f"Initialized {PAGECONF_FILENAME} with default settings")
             self.show_notification(f"Initialized {PAGECONF_FILENAME} with default settings", 'info')
 
+    def use_store(self, store):
+        """Enable per-user configuration, pageconf.yaml stays the shared default layer"""
+        self.store = store
+        self._user_compiled = {}
+
+    def current_user(self) -> Optional[str]:
+        """Browser id of the current client, None unless per-user configuration is enabled"""
+        if self.store is None:
+            return None
+        try:
+            return app.storage.browser['id']
+        except (RuntimeError, KeyError):
+            # app.storage.browser needs ui.run(storage_secret=...)
+            return None
+
     def load(self, route):
         """Retrieve the full configuration for a specific route."""
         return self._conf.get(route, self._conf_default)
 
-    def save(self, route, yaml_str):
-        """Save the configuration for a specific route using a YAML string."""
+    def save(self, route, yaml_str, user=None):
+        """Save the configuration for a specific route using a YAML string, as the user's override if given."""
+        from omegaconf import OmegaConf
         try:
             if not yaml_str.strip():
-                self.delete(route)
+                self.delete(route, user)
+            elif user is not None and self.store is not None:
+                values = OmegaConf.to_container(OmegaConf.create(yaml_str), resolve=True)
+                if not isinstance(values, dict):
+                    raise ValueError("Configuration must be a mapping")
+                self.store.save(user, route, values)
+                self._invalidate_user(user, route)
+                self.notify_pages(None if route == 'default' else route, user)
             else:
                 conf = OmegaConf.create(yaml_str)
-                self._conf[route] = conf
-                OmegaConf.save(self._conf, PAGECONF_FILENAME)
+                # Applied in memory now, written to disk by the next flush
+                self._ensure_loaded()
+                with self._lock:
+                    self._loaded_conf[route] = conf
+                    self._pending[route] = conf
+                    self._invalidate(route)
+                self._schedule_flush()
+                self.notify_pages(None if route == 'default' else route)
         except Exception as e:
             error_message = f"{route} Error message: {str(e)}"
             logger.error(error_message)
@@ -82,23 +297,129 @@ class GlobalPageConf:
 
             raise
 
-    def delete(self, route):
-        """Delete the configuration entry for a specified route."""
-        if route in self._conf:
-            del self._conf[route]
-            OmegaConf.save(self._conf, PAGECONF_FILENAME)
+    def delete(self, route, user=None):
+        """Delete the configuration entry for a specified route, or the user's override of it."""
+        if user is not None and self.store is not None:
+            deleted = self.store.delete(user, route)
+            if deleted:
+                self._invalidate_user(user, route)
+                self.notify_pages(None if route == 'default' else route, user)
+        else:
+            self._ensure_loaded()
+            with self._lock:
+                deleted = route in self._loaded_conf
+                if deleted:
+                    del self._loaded_conf[route]
+                    self._pending[route] = _DELETED
+                    self._invalidate(route)
+            if deleted:
+                self._schedule_flush()
+                self.notify_pages(None if route == 'default' else route)
+        if deleted:
             logger.info(f"Deleted settings for '{route}'")
             self.show_notification(f"Deleted settings '{route}'", 'info')
 
+    def _invalidate(self, route):
+        if route == 'default':
+            self._loaded_conf_default = self._loaded_conf.get("default", PAGECONF_DEFAULT)
+            self._compiled = {}
+        else:
+            self._compiled.pop(route, None)
+
+    def _invalidate_user(self, user, route):
+        with self._lock:
+            self._user_compiled = {key: value for key, value in self._user_compiled.items()
+                                   if key[0] != user or (route != 'default' and key[1] != route)}
+
+    def route_conf(self, route, user=None) -> RouteConf:
+        """
+        Return the compiled configuration of a route, built on first use after a change.
+        With a user and a store, the user's 'default' and route overrides are layered on top.
+        """
+        self._ensure_loaded()
+        compiled = self._compiled.get(route)
+        if compiled is None:
+            from omegaconf import OmegaConf
+            with self._lock:
+                default = self._loaded_conf_default
+                values = dict(default if isinstance(default, dict) else OmegaConf.to_container(default, resolve=True))
+                route_values = self._loaded_conf.get(route)
+                if route_values is not None:
+                    values.update(OmegaConf.to_container(route_values, resolve=True))
+                compiled = self._compiled[route] = RouteConf.compile(route, values)
+            logger.debug(f"Configuration for '{route}': {values}")
+        if user is None or self.store is None:
+            return compiled
+        return self._user_route_conf(route, user, compiled)
+
+    def _user_route_conf(self, route, user, base: RouteConf) -> RouteConf:
+        if self.store.changed():
+            # Written by another worker process
+            self._user_compiled = {}
+        cached = self._user_compiled.get((user, route))
+        # Rebuilt when the YAML layer below was recompiled
+        if cached is not None and cached[0] is base:
+            return cached[1]
+        layers = self.store.layers(user, route)
+        compiled = base
+        if layers:
+            values = dict(base.values)
+            for layer in layers:
+                values.update(layer)
+            compiled = RouteConf.compile(route, values)
+        with self._lock:
+            if len(self._user_compiled) >= USER_CONF_CACHE_SIZE:
+                self._user_compiled = {}
+            self._user_compiled[(user, route)] = (base, compiled)
+        return compiled
+
+    def register_page(self, page):
+        """Register a live page, its apply_pageconf(pageconf, changed) is called on config changes"""
+        self._pages.add(page)
+
+    def notify_pages(self, route=None, user=None):
+        """Push the current config to live pages of a route (all routes if None) whose config differs"""
+        for page in list(self._pages):
+            if route is not None and page.pageinfo.route != route:
+                continue
+            if user is not None and page.user != user:
+                continue
+            new_conf = self.route_conf(page.pageinfo.route, page.user)
+            old_values = page.pageconf.values
+            changed = {key for key in set(old_values) | set(new_conf.values)
+                       if old_values.get(key) != new_conf.values.get(key)}
+            if not changed:
+                continue
+            try:
+                with page.client:
+                    page.apply_pageconf(new_conf, changed)
+            except Exception as e:
+                logger.error(f"Applying configuration to {page.pageinfo.route} failed: {e}")
+
+    async def watch_file(self, poll_interval: float = 1.0):
+        """Notify live pages when pageconf.yaml changes on disk (other worker or manual edit)"""
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            signature = self._signature()
+            while True:
+                await asyncio.sleep(poll_interval)
+                if self._signature() != signature:
+                    signature = self._signature()
+                    self.notify_pages()
+        else:
+            # Watch the directory, an atomic save replaces the file
+            async for _ in awatch(PAGECONF_FILENAME.parent,
+                                  watch_filter=lambda change, path: Path(path).name == PAGECONF_FILENAME.name):
+                self.notify_pages()
+
     def get(self, route, key):
         """Retrieve a specific setting for a route."""
-        conf = self.load(route)
-        logger.debug(f"Configuration for '{route}': {conf}")
-
-        value = conf.get(key, self._conf_default.get(key))
+        value = self.route_conf(route).get(key)
 
         # Raise error if value is None
         if value is None:
+            from omegaconf import OmegaConf
             expected_yaml = OmegaConf.to_yaml({route: {key: "value"}})
             error_message = (
                 f"Configuration error: Required setting '{key}' for '{route}' must not be None.\n"
@@ -110,11 +431,16 @@ class GlobalPageConf:
             raise KeyError(error_message)
         return value
 
-    def to_yaml(self, route):
-        """Convert the configuration for a route to a YAML string."""
+    def to_yaml(self, route, user=None):
+        """Convert the configuration for a route to a YAML string, the user's override if there is one."""
+        from omegaconf import OmegaConf
+        if user is not None and self.store is not None:
+            values = self.store.get(user, route)
+            if values is not None:
+                return OmegaConf.to_yaml(values)
         return OmegaConf.to_yaml(self.load(route))
 
-    def open_settings_dialog(self, pageinfo, on_save: Callable = None):
+    def open_settings_dialog(self, pageinfo, on_save: Callable = None, user=None):
         """Open a dialog for editing the page configuration using NiceGUI."""
         with ui.dialog() as dialog, ui.card().style('min-width: 1000px; max-width: 1000px; height: 500px; top: -17%;'):
             with ui.column().classes('w-full').style('height: 100%; display: flex; flex-direction: column;'):
@@ -131,8 +457,9 @@ class GlobalPageConf:
 
                     # Right Column - YAML Configuration (fills remaining space)
                     with ui.column().style('flex: 1 1 0; padding-top: 0.5rem; height: 100%; overflow: hidden;'):
-                        ui.label('YAML Configuration').classes('text-subtitle text-weight-medium')
-                        yaml_content = self.to_yaml(pageinfo.route)
+                        title = 'YAML Configuration' if user is None else 'YAML Configuration (this browser only)'
+                        ui.label(title).classes('text-subtitle text-weight-medium')
+                        yaml_content = self.to_yaml(pageinfo.route, user)
 
                         editor = ui.codemirror(
                             value=yaml_content,
@@ -158,7 +485,7 @@ class GlobalPageConf:
 
         def save_and_close():
             try:
-                self.save(pageinfo.route, editor.value)
+                self.save(pageinfo.route, editor.value, user)
                 self.show_notification('Configuration saved successfully', 'positive')
                 if on_save:
                     on_save()
@@ -0,0 +1,83 @@
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+PAGECONF_DB_FILENAME = Path(__file__).parent.parent / "pageconf.sqlite3"
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS pageconf (
+    user TEXT NOT NULL,
+    route TEXT NOT NULL,
+    conf TEXT NOT NULL,
+    updated REAL NOT NULL,
+    PRIMARY KEY (user, route)
+) WITHOUT ROWID
+'''
+
+
+class PageConfStore:
+    """
+    Per-user page configuration overrides in a local SQLite database.
+
+    One row per (user, route), the 'default' route holds the user's overrides for all routes.
+    Lookups go through the primary key and saves write a single row,
+    WAL mode lets several worker processes read while one writes.
+    """
+
+    def __init__(self, db_file: Path = PAGECONF_DB_FILENAME):
+        self.db_file = Path(db_file)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(self.db_file, timeout=5.0, isolation_level=None, check_same_thread=False)
+        self._db.execute('PRAGMA journal_mode=WAL')
+        self._db.execute('PRAGMA synchronous=NORMAL')
+        self._db.execute(SCHEMA)
+        self._data_version = self._db.execute('PRAGMA data_version').fetchone()[0]
+        logger.info(f"Per-user page configuration stored in {self.db_file}")
+
+    def changed(self) -> bool:
+        """True when another connection (worker process) committed since the last call"""
+        with self._lock:
+            version = self._db.execute('PRAGMA data_version').fetchone()[0]
+            changed, self._data_version = version != self._data_version, version
+        return changed
+
+    def get(self, user: str, route: str) -> Optional[dict]:
+        """Overrides of one user for one route, None if there are none"""
+        with self._lock:
+            row = self._db.execute('SELECT conf FROM pageconf WHERE user = ? AND route = ?',
+                                   (user, route)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def layers(self, user: str, route: str) -> List[dict]:
+        """The user's 'default' and route overrides, in the order they are applied"""
+        with self._lock:
+            rows = dict(self._db.execute('SELECT route, conf FROM pageconf WHERE user = ? AND route IN (?, ?)',
+                                         (user, 'default', route)).fetchall())
+        return [json.loads(rows[key]) for key in ('default', route) if key in rows]
+
+    def routes(self, user: str) -> Dict[str, dict]:
+        """All overrides of a user, {route: values}"""
+        with self._lock:
+            rows = self._db.execute('SELECT route, conf FROM pageconf WHERE user = ?', (user,)).fetchall()
+        return {route: json.loads(conf) for route, conf in rows}
+
+    def save(self, user: str, route: str, values: dict):
+        with self._lock:
+            self._db.execute(
+                'INSERT INTO pageconf (user, route, conf, updated) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT (user, route) DO UPDATE SET conf = excluded.conf, updated = excluded.updated',
+                (user, route, json.dumps(values, separators=(',', ':')), time.time()))
+
+    def delete(self, user: str, route: str) -> bool:
+        with self._lock:
+            cursor = self._db.execute('DELETE FROM pageconf WHERE user = ? AND route = ?', (user, route))
+        return cursor.rowcount > 0
+
+    def close(self):
+        with self._lock:
+            self._db.close()
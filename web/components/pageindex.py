@@ -0,0 +1,130 @@
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+from web.components.pageinfo import PageInfo
+
+INDEX_VERSION = 2
+
+
+class PageIndex:
+    """
+    On-disk cache of the scanned pages, keyed by file path, mtime and size.
+
+    A directory whose mtime is unchanged has the same entries as when it was indexed,
+    so it is not listed again and its files are only stat-ed.
+    Only new or modified files (mtime or size differ) go through page_from_file again,
+    as ROUTE_PARAMS is read from the file content.
+    """
+
+    def __init__(self, index_file: Path, pages_dir: Path, page_from_file: Callable[[Path], PageInfo]):
+        self.index_file = Path(index_file)
+        self.pages_dir = Path(pages_dir)
+        self.page_from_file = page_from_file
+        self.stats = {'dirs_reused': 0, 'dirs_listed': 0, 'files_reused': 0, 'files_derived': 0}
+
+    def _read(self) -> dict:
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return {}
+        if data.get('version') != INDEX_VERSION or data.get('pages_dir') != str(self.pages_dir):
+            return {}
+        return data.get('dirs', {})
+
+    def _write(self, dirs: dict):
+        # A temporary file of its own, worker processes rebuilding the index at startup write concurrently
+        try:
+            fd, tmp_name = tempfile.mkstemp(dir=self.index_file.parent, prefix=f'{self.index_file.name}.',
+                                            suffix='.tmp')
+        except OSError as e:
+            logger.warning(f"Page index not saved: {e}")
+            return
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'version': INDEX_VERSION, 'pages_dir': str(self.pages_dir), 'dirs': dirs},
+                          f, separators=(',', ':'))
+            os.replace(tmp_name, self.index_file)
+        except BaseException as e:
+            os.unlink(tmp_name)
+            if not isinstance(e, OSError):
+                raise
+            logger.warning(f"Page index not saved: {e}")
+
+    def _file_entry(self, file_path: Path, stat, cached_file: Optional[list]) -> list:
+        if cached_file and cached_file[:2] == [stat.st_mtime_ns, stat.st_size]:
+            self.stats['files_reused'] += 1
+            return cached_file
+        pageinfo = self.page_from_file(file_path)
+        self.stats['files_derived'] += 1
+        return [stat.st_mtime_ns, stat.st_size, pageinfo.route, pageinfo.modulepath,
+                pageinfo.classname, pageinfo.display, list(pageinfo.params)]
+
+    def _restat_dir(self, directory: Path, cached: dict) -> Tuple[dict, bool]:
+        """Check the files of an unchanged directory, return the entry and whether any file changed"""
+        files = {}
+        for name, cached_file in cached['files'].items():
+            file_path = directory / name
+            files[name] = self._file_entry(file_path, file_path.stat(), cached_file)
+        changed = any(files[name] is not cached_file for name, cached_file in cached['files'].items())
+        return dict(cached, files=files), changed
+
+    def _list_dir(self, directory: Path, cached: Optional[dict]) -> dict:
+        """List a changed directory, reusing cached entries of unchanged files"""
+        cached_files = cached['files'] if cached else {}
+        subdirs, files = [], {}
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name != '__pycache__':
+                        subdirs.append(entry.name)
+                elif entry.name.endswith('.py'):
+                    files[entry.name] = self._file_entry(Path(entry.path), entry.stat(), cached_files.get(entry.name))
+        return {'mtime': directory.stat().st_mtime_ns, 'subdirs': sorted(subdirs), 'files': files}
+
+    def load(self) -> Dict[str, PageInfo]:
+        """Return {route: PageInfo} for the pages directory, updating the index file if needed"""
+        cached_dirs = self._read()
+        dirs = {}
+        pages = {}
+        changed = not cached_dirs
+        stack = ['.']
+
+        while stack:
+            relative = stack.pop()
+            directory = self.pages_dir / relative
+            cached = cached_dirs.get(relative)
+            try:
+                mtime = directory.stat().st_mtime_ns
+            except FileNotFoundError:
+                changed = True
+                continue
+
+            if cached and cached['mtime'] == mtime:
+                try:
+                    entry, files_changed = self._restat_dir(directory, cached)
+                except FileNotFoundError:
+                    # Deleted between the directory stat and the file stat
+                    entry, files_changed = self._list_dir(directory, cached), True
+                changed = changed or files_changed
+                self.stats['dirs_reused'] += 1
+            else:
+                entry = self._list_dir(directory, cached)
+                self.stats['dirs_listed'] += 1
+                changed = True
+
+            dirs[relative] = entry
+            for name in entry['subdirs']:
+                stack.append(name if relative == '.' else f'{relative}/{name}')
+            for _, _, route, modulepath, classname, display, params in entry['files'].values():
+                pages[route] = PageInfo(route=route, modulepath=modulepath, classname=classname,
+                                        display=display, params=tuple(params))
+
+        if changed or dirs.keys() != cached_dirs.keys():
+            self._write(dirs)
+        return pages
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Tuple
 
 
 @dataclass
@@ -8,6 +9,12 @@ class PageInfo:
     modulepath: str
     classname: str
     display: str
+    params: Tuple[str, ...] = ()  # ROUTE_PARAMS declared by the page module
+
+    @property
+    def pattern(self) -> str:
+        """Route including its parameter segments, e.g. '/cards/card/{name}'"""
+        return self.route + ''.join(f'/{{{param}}}' for param in self.params)
 
     @property
     def folder(self) -> str:
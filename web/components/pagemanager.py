@@ -1,21 +1,33 @@
+import ast
 import os
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Optional, Tuple
 from loguru import logger
 
+from web.components.pageindex import PageIndex
 from web.components.pageinfo import PageInfo
 from web.components.registry import Registry
+from web.components.routetable import RouteTable, RouteEntry
 
-CURRENT_DIR = Path(__file__).parent.parent
+CURRENT_DIR = Path(__file__).resolve().parent.parent
 PAGES = "pages"
+PAGEINDEX_FILENAME = CURRENT_DIR / ".pageindex.json"
 
 
 class PageManager:
-    def __init__(self):
-        self.pages_dir = CURRENT_DIR / PAGES
+    def __init__(self, pages_dir: Optional[Path] = None, index_file: Optional[Path] = PAGEINDEX_FILENAME):
+        """
+        Args:
+            pages_dir: Root of the page modules, default web/pages
+            index_file: Page index cache file, None to always scan the tree
+        """
+        self.pages_dir = Path(pages_dir) if pages_dir else CURRENT_DIR / PAGES
+        self.root_dir = self.pages_dir.parent.parent  # modulepath is relative to it
+        self.pageindex = PageIndex(index_file, self.pages_dir, self._page_from_file) if index_file else None
+        self.routetable = RouteTable()
         Registry.clear()  # Clear registry on init
 
-    def _create_page_info(self, route: str, modulepath: str) -> PageInfo:
+    def _create_page_info(self, route: str, modulepath: str, params: Tuple[str, ...] = ()) -> PageInfo:
         """Create PageInfo instance"""
         classname = modulepath.split('.')[-1].title().replace('_', '')
         display = modulepath.split('.')[-1].replace('_', ' ').title().replace(' Page', '')
@@ -24,7 +36,8 @@ class PageManager:
             route=route,
             modulepath=modulepath,
             classname=classname,
-            display=display
+            display=display,
+            params=params
         )
 
     def _scan_pages(self) -> Dict[str, PageInfo]:
@@ -40,28 +53,71 @@ class PageManager:
             }
         """
         pages = {}
-        priority_folders = ['cards', 'diagram']
 
         for root, dirs, files in os.walk(self.pages_dir):
-            relative_path = Path(root).relative_to(self.pages_dir)
-
             for file in files:
                 if not file.endswith('.py'):
                     continue
 
-                file_path = Path(root) / file
-                modulename = file_path.stem
-                modulepath = str(file_path.relative_to(CURRENT_DIR.parent)).replace(os.sep, '.').replace('.py', '')
-
-                base_name = modulename.replace('_page', '')
-                if str(relative_path) == '.':
-                    route = f"/{base_name}"
-                else:
-                    route = f"/{relative_path}/{base_name}"
-
-                pages[route] = self._create_page_info(route, modulepath)
+                pageinfo = self._page_from_file(Path(root) / file)
+                pages[pageinfo.route] = pageinfo
         # logger.debug(pages)
-        # Sort pages
+        return self._sort_pages(pages)
+
+    def _load_pages(self) -> Dict[str, PageInfo]:
+        """Scan the pages, through the on-disk page index when enabled."""
+        if self.pageindex is None:
+            return self._scan_pages()
+        try:
+            return self._sort_pages(self.pageindex.load())
+        except Exception as e:
+            logger.warning(f"Page index unusable, scanning {self.pages_dir}: {e}")
+            return self._scan_pages()
+
+    def _page_from_file(self, file_path: Path) -> PageInfo:
+        """Create the PageInfo of a single page file"""
+        relative_path = file_path.parent.relative_to(self.pages_dir)
+        modulename = file_path.stem
+        modulepath = str(file_path.relative_to(self.root_dir)).replace(os.sep, '.').replace('.py', '')
+
+        base_name = modulename.replace('_page', '')
+        if str(relative_path) == '.':
+            route = f"/{base_name}"
+        else:
+            route = f"/{relative_path.as_posix()}/{base_name}"
+
+        return self._create_page_info(route, modulepath, self._read_route_params(file_path))
+
+    @staticmethod
+    def _read_route_params(file_path: Path) -> Tuple[str, ...]:
+        """
+        Read a module level ROUTE_PARAMS = ('name', ...) without importing the module.
+        A page declaring ROUTE_PARAMS = ('name',) is served at '<route>/{name}', a bare string is one parameter.
+        Anything else than strings in a tuple or list is logged and ignored.
+        """
+        try:
+            source = file_path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            return ()
+        if 'ROUTE_PARAMS' not in source:
+            return ()
+        try:
+            for node in ast.parse(source).body:
+                if (isinstance(node, ast.Assign) and len(node.targets) == 1
+                        and isinstance(node.targets[0], ast.Name) and node.targets[0].id == 'ROUTE_PARAMS'):
+                    params = ast.literal_eval(node.value)
+                    if isinstance(params, str):
+                        params = (params,)
+                    if not (isinstance(params, (list, tuple)) and all(isinstance(p, str) for p in params)):
+                        raise TypeError(f"expected a tuple or list of strings, got {params!r}")
+                    return tuple(params)
+        except (SyntaxError, ValueError, TypeError, MemoryError, RecursionError) as e:
+            logger.error(f"{file_path}: invalid ROUTE_PARAMS, ignored: {e}")
+        return ()
+
+    def _sort_pages(self, pages: Dict[str, PageInfo]) -> Dict[str, PageInfo]:
+        """Sort pages: priority folders first, root pages last"""
+        priority_folders = ['cards', 'diagram']
         return dict(
             sorted(pages.items(), key=lambda x: (
                 x[1].folder not in priority_folders,
@@ -71,14 +127,47 @@ class PageManager:
             ))
         )
 
+    def update_files(self, added=(), removed=()):
+        """
+        Apply added and removed page files to the registry without rescanning the tree.
+
+        Args:
+            added: Paths of new page files
+            removed: Paths of deleted page files
+        """
+        pages = dict(self.get_pages())
+        for file_path in removed:
+            pageinfo = self._page_from_file(Path(file_path))
+            if pages.pop(pageinfo.route, None) is not None:
+                logger.info(f"Page removed: {pageinfo.route}")
+        for file_path in added:
+            pageinfo = self._page_from_file(Path(file_path))
+            if pages.get(pageinfo.route) != pageinfo:
+                pages[pageinfo.route] = pageinfo
+                logger.info(f"Page added: {pageinfo.route}")
+        # Copy-on-write, readers always see a complete dict
+        Registry.set_pages(self._sort_pages(pages))
+
     def get_pages(self):
         """Retrieve pages from the Registry, initializing them if necessary."""
         pages = Registry.get_pages()
         if not pages:  # Check if pages is empty
             # logger.debug("Scan pages")
-            Registry.set_pages(self._scan_pages())
+            Registry.set_pages(self._load_pages())
             pages = Registry.get_pages()
 
         return pages
 
+    def resolve(self, route: str) -> Optional[RouteEntry]:
+        """Resolve a route to its page constructor, using the cached route table."""
+        return self.routetable.resolve(route, self.get_pages())
+
+    def match(self, path: str) -> Tuple[Optional[RouteEntry], Dict[str, str]]:
+        """Match a request path to its route entry and the captured route parameters."""
+        return self.routetable.match(path, self.get_pages())
+
+    def prewarm(self, max_workers: int = 4) -> Dict[str, RouteEntry]:
+        """Import every page module up front so no request pays the import cost."""
+        return self.routetable.prewarm(self.get_pages(), max_workers=max_workers)
+
 pagemanager = PageManager()
\ No newline at end of file
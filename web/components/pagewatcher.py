@@ -0,0 +1,97 @@
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Set
+
+from loguru import logger
+
+
+class PageWatcher:
+    """
+    Keeps the registered pages in sync with the pages directory.
+    Uses watchfiles (inotify on Linux, installed with nicegui) and falls back to polling
+    directory mtimes, so only directories whose entries changed are listed again.
+    """
+
+    def __init__(self, pagemanager, poll_interval: float = 1.0):
+        self.pagemanager = pagemanager
+        self.pages_dir = Path(pagemanager.pages_dir).resolve()
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._thread = None
+        self._dir_mtimes: Dict[Path, int] = {}
+        self._dir_files: Dict[Path, Set[Path]] = {}
+
+    def start(self):
+        self.pagemanager.get_pages()  # make sure the initial scan is done
+        self._thread = threading.Thread(target=self._run, name='pagewatcher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+
+    def _run(self):
+        try:
+            from watchfiles import watch, Change
+        except ImportError:
+            logger.info(f"watchfiles not available, polling {self.pages_dir}")
+            self._poll()
+            return
+
+        logger.info(f"Watching {self.pages_dir}")
+        for changes in watch(self.pages_dir, stop_event=self._stop, watch_filter=self._is_page_file):
+            added = {Path(path) for change, path in changes if change != Change.deleted}
+            removed = {Path(path) for change, path in changes if change == Change.deleted}
+            self._apply(added - removed, removed - added)
+
+    @staticmethod
+    def _is_page_file(change, path: str) -> bool:
+        return path.endswith('.py') and '__pycache__' not in path
+
+    def _apply(self, added: Set[Path], removed: Set[Path]):
+        if not added and not removed:
+            return
+        try:
+            self.pagemanager.update_files(added=added, removed=removed)
+        except Exception as e:
+            logger.error(f"Page update failed: {e}")
+
+    def _list_dir(self, directory: Path) -> Set[Path]:
+        files = set()
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir() and entry.name != '__pycache__':
+                    self._dir_mtimes.setdefault(Path(entry.path), None)
+                elif self._is_page_file(None, entry.name):
+                    files.add(Path(entry.path))
+        return files
+
+    def _poll(self):
+        """Stat every directory, list only the ones whose mtime changed"""
+        # Initial state matches the scan the registry was built from
+        for root, dirs, files in os.walk(self.pages_dir):
+            dirs[:] = [d for d in dirs if d != '__pycache__']
+            directory = Path(root)
+            self._dir_mtimes[directory] = directory.stat().st_mtime_ns
+            self._dir_files[directory] = {directory / file for file in files if self._is_page_file(None, file)}
+
+        while not self._stop.wait(self.poll_interval):
+            added, removed = set(), set()
+            for directory in list(self._dir_mtimes):
+                try:
+                    mtime = directory.stat().st_mtime_ns
+                except FileNotFoundError:
+                    removed |= self._dir_files.pop(directory, set())
+                    del self._dir_mtimes[directory]
+                    continue
+                if mtime == self._dir_mtimes[directory]:
+                    continue
+                self._dir_mtimes[directory] = mtime
+                files = self._list_dir(directory)
+                previous = self._dir_files.get(directory, set())
+                added |= files - previous
+                removed |= previous - files
+                self._dir_files[directory] = files
+            self._apply(added, removed)
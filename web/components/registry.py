@@ -4,15 +4,20 @@ class Registry:
     """Singleton registry for application pages and menu"""
     _pages = {}
     _menu = None
+    _generation = 0
 
     @classmethod
     def clear(cls):
         """Clear the registry"""
         cls._pages = {}
         cls._menu = None
+        cls._generation += 1
 
     @classmethod
     def set_pages(cls, pages):
+        if pages != cls._pages:
+            cls._menu = None
+            cls._generation += 1
         cls._pages = pages
 
     @classmethod
@@ -25,4 +30,14 @@ class Registry:
 
     @classmethod
     def get_menu(cls):
-        return cls._menu
\ No newline at end of file
+        return cls._menu
+
+    @classmethod
+    def invalidate(cls):
+        """Mark everything derived from the pages (routes, menu) as stale"""
+        cls._menu = None
+        cls._generation += 1
+
+    @classmethod
+    def get_generation(cls) -> int:
+        return cls._generation
@@ -0,0 +1,140 @@
+import importlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from loguru import logger
+
+from web.components.pageinfo import PageInfo
+from web.components.registry import Registry
+from web.components.routetrie import RouteTrie
+
+
+@dataclass
+class RouteEntry:
+    """Resolved route: page constructor and its PageInfo"""
+    pageinfo: PageInfo
+    page_class: Optional[Callable] = None
+    error: Optional[str] = None
+    import_time: float = 0.0
+
+
+class RouteTable:
+    """
+    Maps routes straight to page constructors.
+    Entries are resolved once and dropped when the Registry generation changes
+    (page rescan or module reload).
+    """
+
+    def __init__(self):
+        self._entries: Dict[str, RouteEntry] = {}
+        self._trie: Optional[RouteTrie] = None
+        self._generation = None
+        self._timings: Dict[str, list] = {}  # phase -> [count, total, max]
+        self._lock = threading.Lock()
+
+    def record(self, phase: str, seconds: float):
+        """Accumulate the duration of a dispatch phase"""
+        with self._lock:
+            stats = self._timings.setdefault(phase, [0, 0.0, 0.0])
+            stats[0] += 1
+            stats[1] += seconds
+            stats[2] = max(stats[2], seconds)
+
+    def get_timings(self) -> Dict[str, dict]:
+        """Return per-phase dispatch timings in milliseconds"""
+        return {
+            phase: {
+                'count': count,
+                'total_ms': total * 1000,
+                'avg_ms': total * 1000 / count,
+                'max_ms': maximum * 1000
+            }
+            for phase, (count, total, maximum) in self._timings.items()
+        }
+
+    def _check_generation(self):
+        generation = Registry.get_generation()
+        if generation != self._generation:
+            if self._entries:
+                logger.debug(f"Route table invalidated ({len(self._entries)} entries)")
+            self._entries = {}
+            self._trie = None
+            self._generation = generation
+
+    def _compile(self, pageinfo: PageInfo) -> RouteEntry:
+        """Import the page module and look up its class"""
+        start = time.perf_counter()
+        try:
+            module = importlib.import_module(pageinfo.modulepath)
+        except Exception as e:
+            import_time = time.perf_counter() - start
+            self.record('import', import_time)
+            return RouteEntry(pageinfo, error=f"Error importing {pageinfo.modulepath}\n {pageinfo}: \n{str(e)}",
+                              import_time=import_time)
+        imported = time.perf_counter()
+        self.record('import', imported - start)
+
+        page_class = getattr(module, pageinfo.classname, None)
+        self.record('getattr', time.perf_counter() - imported)
+        if page_class is None:
+            return RouteEntry(pageinfo, error=f"Class {pageinfo.classname} not found in module",
+                              import_time=imported - start)
+        return RouteEntry(pageinfo, page_class=page_class, import_time=imported - start)
+
+    def resolve(self, route: str, pages: Dict[str, PageInfo]) -> Optional[RouteEntry]:
+        """Return the compiled entry for a route, None if the route is unknown"""
+        start = time.perf_counter()
+        self._check_generation()
+        entry = self._entries.get(route)
+        if entry is None:
+            pageinfo = pages.get(route)
+            if pageinfo is None:
+                return None
+            entry = self._compile(pageinfo)
+            if entry.error:
+                logger.error(entry.error)
+            self._entries[route] = entry
+        self.record('resolve', time.perf_counter() - start)
+        return entry
+
+    def match(self, path: str, pages: Dict[str, PageInfo]) -> Tuple[Optional[RouteEntry], Dict[str, str]]:
+        """Match a request path, including parameterized routes, to its entry and captured parameters"""
+        self._check_generation()
+        if self._trie is None:
+            self._trie = RouteTrie(pages)
+        pageinfo, params = self._trie.match(path)
+        if pageinfo is None:
+            return None, {}
+        return self.resolve(pageinfo.route, pages), params
+
+    def prewarm(self, pages: Dict[str, PageInfo], max_workers: int = 4) -> Dict[str, RouteEntry]:
+        """
+        Import all page modules in a thread pool and fill the table.
+        Routes whose module fails to import are kept as broken entries.
+        """
+        self._check_generation()
+        pending = [pageinfo for route, pageinfo in pages.items() if route not in self._entries]
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='prewarm') as executor:
+            entries = list(executor.map(self._compile, pending))
+
+        for entry in entries:
+            self._entries[entry.pageinfo.route] = entry
+
+        lines = [f"{'route':<40} {'module':<50} {'ms':>8}  status"]
+        for entry in sorted(entries, key=lambda e: e.import_time, reverse=True):
+            status = 'ok' if entry.error is None else 'BROKEN'
+            lines.append(f"{entry.pageinfo.route:<40} {entry.pageinfo.modulepath:<50} "
+                         f"{entry.import_time * 1000:>8.1f}  {status}")
+        logger.info("Page modules prewarmed:\n" + "\n".join(lines))
+        for entry in entries:
+            if entry.error:
+                logger.error(entry.error)
+
+        return self._entries
+
+    def get_entries(self) -> Dict[str, RouteEntry]:
+        self._check_generation()
+        return self._entries
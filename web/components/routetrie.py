@@ -0,0 +1,58 @@
+from typing import Dict, Optional, Tuple
+
+from loguru import logger
+
+from web.components.pageinfo import PageInfo
+
+
+class _Node:
+    __slots__ = ('children', 'param', 'param_child', 'pageinfo')
+
+    def __init__(self):
+        self.children: Dict[str, '_Node'] = {}
+        self.param: Optional[str] = None
+        self.param_child: Optional['_Node'] = None
+        self.pageinfo: Optional[PageInfo] = None
+
+
+class RouteTrie:
+    """
+    Segment trie of page routes.
+    Static segments are dict lookups, a page's ROUTE_PARAMS become wildcard segments,
+    so matching costs O(path depth) whatever the number of pages.
+    """
+
+    def __init__(self, pages: Dict[str, PageInfo]):
+        self._root = _Node()
+        for pageinfo in pages.values():
+            try:
+                self.add(pageinfo)
+            except ValueError as e:
+                logger.error(f"Route skipped: {e}")
+
+    def add(self, pageinfo: PageInfo):
+        node = self._root
+        for segment in pageinfo.route.strip('/').split('/'):
+            node = node.children.setdefault(segment, _Node())
+        for param in pageinfo.params:
+            if node.param_child is None:
+                node.param = param
+                node.param_child = _Node()
+            elif node.param != param:
+                raise ValueError(f"{pageinfo.route}: parameter '{param}' conflicts with '{node.param}'")
+            node = node.param_child
+        node.pageinfo = pageinfo
+
+    def match(self, path: str) -> Tuple[Optional[PageInfo], Dict[str, str]]:
+        """Return the PageInfo matching the path and the captured parameters"""
+        node = self._root
+        params = {}
+        for segment in path.strip('/').split('/'):
+            child = node.children.get(segment)
+            if child is None:
+                if node.param_child is None or not segment:
+                    return None, {}
+                params[node.param] = segment
+                child = node.param_child
+            node = child
+        return node.pageinfo, (params if node.pageinfo else {})
@@ -0,0 +1,130 @@
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from loguru import logger
+
+if TYPE_CHECKING:
+    import polars as pl
+
+MAX_SEGMENTS = 8  # appended segments kept before the postings are rebuilt into one
+INTERSECT_RATIO = 16  # postings longer than this many times the candidates are not intersected
+
+
+def search_key(columns: List[str]) -> 'pl.Expr':
+    """
+    The lowercased columns joined into one search key per row, shared by SearchIndex and
+    the browser quick search of AgGridPolars so both match the same text.
+    """
+    import polars as pl
+
+    # Newline separated so a query does not match across two columns
+    return pl.concat_str(
+        [pl.col(column).cast(pl.String).str.to_lowercase().fill_null('') for column in columns],
+        separator='\n'
+    )
+
+
+class _Segment:
+    """Postings of a block of rows: one flat row Series grouped by gram, and {gram: (offset, length)}"""
+    __slots__ = ('rows', 'spans')
+
+    def __init__(self, rows: 'pl.Series', spans: Dict[str, Tuple[int, int]]):
+        self.rows = rows
+        self.spans = spans
+
+    def postings(self, gram: str) -> Optional['pl.Series']:
+        span = self.spans.get(gram)
+        return None if span is None else self.rows.slice(*span)
+
+
+class SearchIndex:
+    """
+    Case-insensitive 'contains' search over string columns of a DataFrame.
+
+    The columns are lowercased once into one key per row, and every n-gram of the keys
+    points to the sorted positions of the rows containing it. A query intersects the postings
+    of its n-grams, starting with the shortest, and only the remaining candidates are
+    checked with str.contains. Queries shorter than n scan the precomputed keys.
+    append() indexes new rows in a segment of their own, without touching the existing ones.
+    """
+
+    def __init__(self, df: 'pl.DataFrame', columns: List[str], n: int = 3):
+        import polars as pl
+
+        self.columns = columns
+        self.n = n
+        self.keys = pl.Series('key', [], dtype=pl.String)
+        self._segments: List[_Segment] = []
+        self.append(df)
+
+    def __len__(self) -> int:
+        return self.keys.len()
+
+    def _row_keys(self, df: 'pl.DataFrame') -> 'pl.Series':
+        return df.select(search_key(self.columns).alias('key')).to_series()
+
+    def _build_segment(self, keys: 'pl.Series', offset: int) -> _Segment:
+        import polars as pl
+
+        # Grouping keeps the row order within a gram, so the postings are sorted without a sort
+        postings = (
+            pl.DataFrame({'row': pl.int_range(offset, offset + keys.len(), dtype=pl.UInt32, eager=True),
+                          'key': keys})
+            .with_columns(start=pl.int_ranges(0, pl.max_horizontal(pl.col('key').str.len_chars() - self.n + 1, 0)))
+            .explode('start')
+            .drop_nulls('start')
+            .select('row', gram=pl.col('key').str.slice(pl.col('start'), self.n))
+            .group_by('gram')
+            .agg(pl.col('row').unique(maintain_order=True))
+        )
+        spans, position = {}, 0
+        for gram, length in zip(postings['gram'].to_list(), postings['row'].list.len().to_list()):
+            spans[gram] = (position, length)
+            position += length
+        return _Segment(postings['row'].explode(), spans)
+
+    def append(self, df: 'pl.DataFrame'):
+        """Index rows appended to the frame, their positions follow the rows already indexed"""
+        keys = self._row_keys(df)
+        offset = self.keys.len()
+        self.keys = self.keys.append(keys) if offset else keys
+        if len(self._segments) >= MAX_SEGMENTS:
+            self._segments = [self._build_segment(self.keys, 0)]
+            logger.debug(f"Search index rebuilt, {self.keys.len()} rows")
+        elif keys.len():
+            self._segments.append(self._build_segment(keys, offset))
+
+    def _postings(self, gram: str) -> 'pl.Series':
+        import polars as pl
+
+        # Segments hold increasing row ranges, so the concatenation stays sorted
+        parts = [postings for postings in (segment.postings(gram) for segment in self._segments)
+                 if postings is not None]
+        if not parts:
+            return pl.Series('row', [], dtype=pl.UInt32)
+        return parts[0] if len(parts) == 1 else pl.concat(parts)
+
+    def search(self, text: Optional[str]) -> 'pl.Series':
+        """Sorted positions (UInt32) of the rows containing text, all rows for an empty text"""
+        import polars as pl
+
+        text = (text or '').lower()
+        if not text:
+            return pl.int_range(0, self.keys.len(), dtype=pl.UInt32, eager=True)
+
+        if len(text) < self.n:
+            candidates = pl.int_range(0, self.keys.len(), dtype=pl.UInt32, eager=True)
+            keys = self.keys
+        else:
+            grams = {text[i:i + self.n] for i in range(len(text) - self.n + 1)}
+            postings = sorted((self._postings(gram) for gram in grams), key=len)
+            candidates = postings[0]
+            for other in postings[1:]:
+                # Intersecting with a much longer list costs more than checking the few candidates left
+                if candidates.is_empty() or other.len() > INTERSECT_RATIO * candidates.len():
+                    break
+                candidates = candidates.filter(candidates.is_in(other))
+            if candidates.is_empty():
+                return candidates
+            keys = self.keys.gather(candidates)
+        # The n-grams can come from different places of a key, confirm the substring
+        return candidates.filter(keys.str.contains(text, literal=True))
@@ -1,15 +1,57 @@
+import hashlib
+import json
+
+from loguru import logger
 from nicegui import ui
-from components.modulereloader import ModuleReloader
+from components.modulereloader import reloader
 
 from components.pagemanager import pagemanager
+from web.components.registry import Registry
 
 
-reloader = ModuleReloader()
+_menu_script = (None, None, None)  # (menu html, script, etag)
 
 def create_menu():
+    """Return the menu HTML, built once per page registry generation"""
+    pages = pagemanager.get_pages()
+    menu_html = Registry.get_menu()
+    if menu_html is None:
+        menu_html = _build_menu(pages)
+        Registry.set_menu(menu_html)
+    return menu_html
+
+def menu_script():
+    """
+    Return (script, etag) defining the <nav-menu> element with the current menu.
+    The script is served from /menu.js so browsers cache it instead of receiving the menu with every page.
+    """
+    global _menu_script
+    menu_html = create_menu()
+    if _menu_script[0] is not menu_html:
+        script = (
+            "(() => {\n"
+            f"  const html = {json.dumps(menu_html)};\n"
+            "  if (customElements.get('nav-menu')) return;\n"
+            "  customElements.define('nav-menu', class extends HTMLElement {\n"
+            "    connectedCallback() { this.style.display = 'contents'; this.innerHTML = html; }\n"
+            "  });\n"
+            "})();\n"
+        )
+        etag = '"' + hashlib.md5(script.encode()).hexdigest() + '"'
+        _menu_script = (menu_html, script, etag)
+    return _menu_script[1], _menu_script[2]
+
+def add_menu():
+    """Add the navigation menu, rendered in the browser from the cached /menu.js"""
+    ui.add_head_html('<script src="/menu.js"></script>')
+    ui.html('<nav-menu></nav-menu>')
+
+def _build_menu(pages: dict) -> str:
     # Group pages by folder
     grouped_pages  = {}
-    for route, page_info in pagemanager.get_pages().items():
+    for route, page_info in pages.items():
+        if page_info.params:  # needs parameters, not reachable from the menu
+            continue
         folder = page_info.folder
         if folder not in grouped_pages:
             grouped_pages[folder] = []
@@ -78,13 +120,57 @@ def _organize_pages_by_folder(pages: dict) -> dict:
 
     return dict(sorted(folder_pages.items()))  # Return sorted by folder name
 
-def reload_modules():
+def _affected_clients(result) -> list:
+    """Connected clients showing a page whose module was reloaded"""
+    from nicegui import Client
+
+    clients = []
+    for client in list(Client.instances.values()):
+        request = getattr(client, 'request', None)
+        if request is None or not client.has_socket_connection:
+            continue
+        entry, _ = pagemanager.match('/' + request.url.path.strip('/'))
+        if entry is not None and entry.pageinfo.modulepath in result.reloaded:
+            clients.append(client)
+    return clients
 
+def reload_with_notice(message: str, type: str = 'info'):
+    """
+    Reload the page in the browser and show the notice on the reloaded page (static/notice.js),
+    a ui.notify sent before the reload would disappear with the old page.
+    """
+    notice = json.dumps({'message': message, 'type': type})
+    ui.run_javascript(f"sessionStorage.setItem('dashboard_notice', {json.dumps(notice)}); location.reload();")
+
+def refresh_clients(result, exclude=None):
+    """Reload the pages of all clients affected by a module reload, leave the others untouched"""
+    clients = [client for client in _affected_clients(result) if client is not exclude]
+    for client in clients:
+        with client:
+            reload_with_notice('Page code was updated')
+    return clients
+
+async def reload_if_notified():
+    """Follow module reloads triggered in other worker processes, wait for a running reload"""
+    await reloader.wait_for_reload()
+    if reloader.is_notified():
+        result = await reloader.reload_if_notified_async()
+        refresh_clients(result)
+
+async def reload_modules():
+    """Reload changed modules off the event loop and refresh the clients whose page changed"""
+    current_client = ui.context.client
     try:
-        modules_reloaded = reloader.reload_project_modules()
-        ui.notify(f'Successfully reloaded {len(modules_reloaded)} modules', type='positive')
+        result = await reloader.reload_async()
+        reloader.notify_workers()
+        refreshed = refresh_clients(result, exclude=current_client)
+        logger.info(f"Refreshed {len(refreshed)} clients after reload")
     except Exception as e:
-        ui.notify(f'Error reloading dependencies: {str(e)}', type='negative')
-
-    finally:
-        ui.navigate.reload()
\ No newline at end of file
+        with current_client:
+            ui.notify(f'Error reloading dependencies: {str(e)}', type='negative')
+        return
+
+    # The clicking client always gets its page rebuilt with the reloaded code
+    with current_client:
+        reload_with_notice(f'Successfully reloaded {len(result.reloaded)} modules, '
+                           f'{len(result.skipped)} unchanged', type='positive')
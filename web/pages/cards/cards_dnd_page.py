@@ -5,11 +5,52 @@ import polars as pl
 
 from nicegui import ui
 
+from web.components.keyindex import KeyIndex
 from web.components.pageinfo import PageInfo
-from web.pages.cards.cards_polars_page import map_polars_aggrid_schema
+from web.components.searchindex import SearchIndex
 
 from web.pagetemplate import PageTemplate
 
+def map_polars_aggrid_schema(df: pl.DataFrame, checkbox_field: Optional[str] = None) -> list[dict]:
+    """Generate AG Grid column definitions using only community features."""
+    column_defs = []
+
+    for col_name in df.columns:
+        dtype = df.schema[col_name]
+        col_def = {
+            'field': col_name,
+            'headerName': col_name.replace('_', ' ').title(),
+            'floatingFilter': True
+        }
+
+        # Add checkbox if specified
+        if checkbox_field and col_name == checkbox_field:
+            col_def['checkboxSelection'] = True
+            col_def['headerCheckboxSelection'] = True
+
+        # Configure basic filters based on data type
+        if dtype in (pl.Float32, pl.Float64, pl.Int32, pl.Int64):
+            col_def['filterParams'] = {
+                'filterOptions': ['equals', 'greaterThan', 'lessThan'],
+                'defaultOption': 'equals',
+                "defaultJoinOperator": "OR"
+            }
+        elif dtype == pl.Boolean:
+            col_def['filter'] = 'agTextColumnFilter'  # Fall back to text filter for booleans
+        elif dtype == pl.Date:
+            col_def['filter'] = 'agDateColumnFilter'  # Basic date filter
+        else:
+            col_def['filterParams'] = {
+                'filterOptions': ['contains', 'equals', 'startsWith', 'endsWith'],
+                'defaultOption': 'contains',
+                "defaultJoinOperator": "OR"
+            }
+
+        column_defs.append(col_def)
+
+    return column_defs
+
+
 # Global variables to track drag and drop state
 dragged = None
 drop_target = None
@@ -187,6 +228,16 @@ class CardContainer(ui.grid):
             card.delete()
         self.ui_cards.clear()
 
+    def set_columns(self, columns: int) -> None:
+        """Change the number of cards per row in place"""
+        self.style(f'grid-template-columns: repeat({columns}, minmax(0, 1fr))')
+
+    def set_card_height(self, card_height: int) -> None:
+        """Change the height of all cards in place"""
+        self.card_height = card_height
+        for card in self.ui_cards.values():
+            card.style(f'height: {card_height}px;')
+
     def reorder_cards(self, dragged_card: CardTemplate, target_card: CardTemplate) -> None:
         """Reorder cards after drag and drop"""
         dragged_name = dragged_card.name
@@ -235,6 +286,9 @@ class CardsDndPage(PageTemplate):
             'created_date': pl.Series([date(2024, 1, i) for i in range(1, 15)], dtype=pl.Date)
         })
 
+        self.search_index = SearchIndex(self.df, ['name', 'description'])
+        self.key_index = KeyIndex(self.df, 'name')
+
         # Track selected cards
         self.selected_card_names: Set[str] = set()
 
@@ -268,25 +322,31 @@ class CardsDndPage(PageTemplate):
         }
 
         self.ui_cards_aggrid = ui.aggrid(grid_config, theme='balham-dark').classes('w-full') \
-            .style(f'height: {self.pageconf.get("sidebar_cards_grid_height")}px')
+            .style(f'height: {self.pageconf.sidebar_cards_grid_height}px')
         self.ui_cards_aggrid.on('selectionChanged', self.handle_card_select)
 
     def main(self):
         """Initialize main content area with cards grid"""
         self.ui_card_container = CardContainer(
-            columns=self.pageconf.get("cards_per_row"),
+            columns=self.pageconf.cards_per_row,
             card_type=CardType.COMMON,
-            card_height=self.pageconf.get("card_height"),
+            card_height=self.pageconf.card_height,
             on_remove=self.handle_card_remove
         )
 
+    def apply_pageconf(self, pageconf, changed: set):
+        """Resize the grid and cards in place on configuration changes"""
+        super().apply_pageconf(pageconf, changed)
+        if 'sidebar_cards_grid_height' in changed:
+            self.ui_cards_aggrid.style(f'height: {pageconf.sidebar_cards_grid_height}px')
+        if 'cards_per_row' in changed:
+            self.ui_card_container.set_columns(pageconf.cards_per_row)
+        if 'card_height' in changed:
+            self.ui_card_container.set_card_height(pageconf.card_height)
+
     def handle_search(self, event):
         """Filter grid data based on search input"""
-        search_text = event.value.lower() if event.value is not None else ''
-        filtered_data = self.df.filter(
-            pl.col('name').str.to_lowercase().str.contains(search_text) |
-            pl.col('description').str.to_lowercase().str.contains(search_text)
-        ).to_dicts()
+        filtered_data = self.df[self.search_index.search(event.value)].to_dicts()
         self.ui_cards_aggrid.options['rowData'] = filtered_data
         self.ui_cards_aggrid.update()
 
@@ -307,8 +367,7 @@ class CardsDndPage(PageTemplate):
 
         # Add newly selected cards
         cards_to_add = newly_selected_names - self.selected_card_names
-        for card_name in cards_to_add:
-            card_dict = self.df.filter(pl.col('name') == card_name).to_dicts()[0]
+        for card_name, card_dict in self.key_index.dicts(cards_to_add).items():
             self.ui_card_container.add_card(card_name, card_dict)
 
         self.selected_card_names = newly_selected_names
\ No newline at end of file
@@ -12,8 +12,16 @@ from web.components.cards.cardtypes import CardType
 
 
 class CardsModulPage(PageTemplate):
+    progressive = True
+
     def __init__(self, **kwargs):
-        # Initialize data
+        self.df: Optional[pl.DataFrame] = None
+        self.cls_card_container: Optional[CardContainer] = None
+        self.cls_aggrid_polars: Optional[AgGridPolars] = None
+        super().__init__(**kwargs)
+
+    def load_data(self):
+        """Initialize data, runs in a worker thread after the shell is sent"""
         self.df = pl.DataFrame({
             'name': pl.Series(['Card ' + str(i) for i in range(1, 15)], dtype=pl.String),
             'description': pl.Series(['Description ' + str(i+5) for i in range(1, 15)], dtype=pl.String),
@@ -21,9 +29,6 @@ class CardsModulPage(PageTemplate):
             'active': pl.Series([i % 2 == 0 for i in range(1, 15)], dtype=pl.Boolean),
             'created_date': pl.Series([date(2024, 1, i) for i in range(1, 15)], dtype=pl.Date)
         })
-        self.cls_card_container: Optional[CardContainer] = None
-        self.cls_aggrid_polars: Optional[AgGridPolars] = None
-        super().__init__(**kwargs)
 
     def sidebar(self):
         """Create sidebar with search and data grid"""
@@ -34,7 +39,7 @@ class CardsModulPage(PageTemplate):
         self.cls_aggrid_polars = AgGridPolars(
             df=self.df,
             checkbox_field='name',
-            grid_height=self.pageconf.get("sidebar_cards_grid_height"),
+            grid_height=self.pageconf.sidebar_cards_grid_height,
             on_selection_change=self.handle_selection_change
         )
         self.cls_aggrid_polars.create_grid()
@@ -42,12 +47,22 @@ class CardsModulPage(PageTemplate):
     def main(self):
         """Initialize main content area with cards grid"""
         self.cls_card_container = CardContainer(
-            columns=self.pageconf.get("cards_per_row"),
+            columns=self.pageconf.cards_per_row,
             card_type=CardType.CHART,
-            card_height=self.pageconf.get("card_height"),
+            card_height=self.pageconf.card_height,
             on_remove=self.handle_card_remove
         )
 
+    def apply_pageconf(self, pageconf, changed: set):
+        """Resize the grid and cards in place on configuration changes"""
+        super().apply_pageconf(pageconf, changed)
+        if 'sidebar_cards_grid_height' in changed:
+            self.cls_aggrid_polars.set_height(pageconf.sidebar_cards_grid_height)
+        if 'cards_per_row' in changed:
+            self.cls_card_container.set_columns(pageconf.cards_per_row)
+        if 'card_height' in changed:
+            self.cls_card_container.set_card_height(pageconf.card_height)
+
     async def handle_search(self, event):
         """Filter grid data based on name field"""
         search_text = event.value if event.value is not None else ''
@@ -64,6 +79,5 @@ class CardsModulPage(PageTemplate):
             self.cls_card_container.remove_card(card_name)
 
         # Add newly selected cards
-        for card_name in added:
-            card_dict = self.df.filter(pl.col('name') == card_name).to_dicts()[0]
+        for card_name, card_dict in self.cls_aggrid_polars.rows_by_key(added).items():
             self.cls_card_container.add_card(card_name, card_dict)
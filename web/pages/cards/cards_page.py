@@ -58,11 +58,22 @@ class CardsPage(PageTemplate):
 
         self.data_grid = ui.aggrid(grid_config, theme='balham-dark') \
             .classes('w-full') \
-            .style(f'height: {self.pageconf.get("sidebar_cards_grid_height")}px')
+            .style(f'height: {self.pageconf.sidebar_cards_grid_height}px')
 
     def main(self):
         """Initialize main content area with cards grid"""
-        self.cards_display_grid = ui.grid(columns=self.pageconf.get("cards_per_row")).classes('w-full')
+        self.cards_display_grid = ui.grid(columns=self.pageconf.cards_per_row).classes('w-full')
+
+    def apply_pageconf(self, pageconf, changed: set):
+        """Resize the grid and cards in place on configuration changes"""
+        super().apply_pageconf(pageconf, changed)
+        if 'sidebar_cards_grid_height' in changed:
+            self.data_grid.style(f'height: {pageconf.sidebar_cards_grid_height}px')
+        if 'cards_per_row' in changed:
+            self.cards_display_grid.style(f'grid-template-columns: repeat({pageconf.cards_per_row}, minmax(0, 1fr))')
+        if 'card_height' in changed:
+            for card in self.card_ui_elements.values():
+                card.style(f'height: {pageconf.card_height}px')
 
     def events(self):
         """Bind all event handlers"""
@@ -98,7 +109,7 @@ class CardsPage(PageTemplate):
             return
 
         with self.cards_display_grid:
-            with ui.card().classes('w-full h-full').style(f'height: {self.pageconf.get("card_height")}px; padding: 0') as card:
+            with ui.card().classes('w-full h-full').style(f'height: {self.pageconf.card_height}px; padding: 0') as card:
                 # Card header
                 with ui.row().classes('w-full flex items-center h-10 bg-[#262b2e]'):
                     ui.label(card_name).classes('flex-grow text-md pl-2')
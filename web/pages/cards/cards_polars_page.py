@@ -3,49 +3,11 @@ from datetime import date
 import polars as pl
 from nicegui import ui
 
+from web.components.aggrid_polars import AgGridPolars
 from web.components.pageinfo import PageInfo
 
 from web.pagetemplate import PageTemplate
 
-def map_polars_aggrid_schema(df: pl.DataFrame, checkbox_field: Optional[str] = None) -> list[dict]:
-    """Generate AG Grid column definitions using only community features."""
-    column_defs = []
-
-    for col_name in df.columns:
-        dtype = df.schema[col_name]
-        col_def = {
-            'field': col_name,
-            'headerName': col_name.replace('_', ' ').title(),
-            'floatingFilter': True
-        }
-
-        # Add checkbox if specified
-        if checkbox_field and col_name == checkbox_field:
-            col_def['checkboxSelection'] = True
-            col_def['headerCheckboxSelection'] = True
-
-        # Configure basic filters based on data type
-        if dtype in (pl.Float32, pl.Float64, pl.Int32, pl.Int64):
-            col_def['filterParams'] = {
-                'filterOptions': ['equals', 'greaterThan', 'lessThan'],
-                'defaultOption': 'equals',
-                "defaultJoinOperator": "OR"
-            }
-        elif dtype == pl.Boolean:
-            col_def['filter'] = 'agTextColumnFilter'  # Fall back to text filter for booleans
-        elif dtype == pl.Date:
-            col_def['filter'] = 'agDateColumnFilter'  # Basic date filter
-        else:
-            col_def['filterParams'] = {
-                'filterOptions': ['contains', 'equals', 'startsWith', 'endsWith'],
-                'defaultOption': 'contains',
-                "defaultJoinOperator": "OR"
-            }
-
-        column_defs.append(col_def)
-
-    return column_defs
-
 class CardsPolarsPage(PageTemplate):
     def __init__(self, **kwargs):
         # Initialize data
@@ -64,7 +26,7 @@ class CardsPolarsPage(PageTemplate):
 
         # UI component references
         self.search_input: Optional[ui.input] = None
-        self.cards_aggrid: Optional[ui.aggrid] = None
+        self.cls_aggrid_polars: Optional[AgGridPolars] = None
         self.cards_container: Optional[ui.grid] = None
 
         super().__init__(**kwargs)
@@ -72,76 +34,60 @@ class CardsPolarsPage(PageTemplate):
     def sidebar(self):
         """Create sidebar with search and data grid"""
         with ui.row().classes('w-full'):
+            # Debounced, the search text is the only data sent to the browser
             self.search_input = ui.input(placeholder='Quick search...', on_change=self._handle_quick_search) \
-                .props('dense') \
+                .props('dense debounce=250') \
                 .classes('w-full custom-input')
 
-        # Configure data grid with community edition features
-        grid_config = {
-            'defaultColDef': {
-                'sortable': True,
-                'filter': True,
-                'resizable': True
-            },
-            'columnDefs': map_polars_aggrid_schema(self.df, checkbox_field='name'),
-            'rowSelection': 'multiple',
-            'rowMultiSelectWithClick': True,
-            ':getRowId': '(params) => params.data.name',
-            'rowData': self.df.to_dicts(),
-            'suppressFieldDotNotation': True
-        }
-
-        self.cards_aggrid = ui.aggrid(grid_config, theme='balham-dark') \
-            .classes('w-full') \
-            .style(f'height: {self.pageconf.get("sidebar_cards_grid_height")}px')
+        self.cls_aggrid_polars = AgGridPolars(
+            df=self.df,
+            checkbox_field='name',
+            grid_height=self.pageconf.sidebar_cards_grid_height,
+            on_selection_change=self._handle_card_selection_change,
+            quick_search_columns=['name', 'description']
+        )
+        self.cls_aggrid_polars.create_grid()
 
     def main(self):
         """Initialize main content area with cards grid"""
-        self.cards_container = ui.grid(columns=self.pageconf.get("cards_per_row")).classes('w-full')
-
-    def events(self):
-        """Bind all event handlers"""
-        self.cards_aggrid.on('selectionChanged', self._handle_card_selection_change)
+        self.cards_container = ui.grid(columns=self.pageconf.cards_per_row).classes('w-full')
+
+    def shortcuts(self):
+        """Ctrl+K focuses the quick search"""
+        return {**super().shortcuts(), 'ctrl+k': lambda: self.search_input.run_method('focus')}
+
+    def apply_pageconf(self, pageconf, changed: set):
+        """Resize the grid and cards in place on configuration changes"""
+        super().apply_pageconf(pageconf, changed)
+        if 'sidebar_cards_grid_height' in changed:
+            self.cls_aggrid_polars.set_height(pageconf.sidebar_cards_grid_height)
+        if 'cards_per_row' in changed:
+            self.cards_container.style(f'grid-template-columns: repeat({pageconf.cards_per_row}, minmax(0, 1fr))')
+        if 'card_height' in changed:
+            for card in self.card_ui_elements.values():
+                card.style(f'height: {pageconf.card_height}px')
 
     def _handle_quick_search(self, event):
-        """Filter grid data based on search input"""
-        search_text = event.value.lower() if event.value is not None else ''
-
-        # Manual filtering since quickFilter is an enterprise feature
-        filtered_data = self.df.filter(
-            pl.col('name').str.to_lowercase().str.contains(search_text) |
-            pl.col('description').str.to_lowercase().str.contains(search_text)
-        ).to_dicts()
-
-        self.cards_aggrid.options['rowData'] = filtered_data
-        self.cards_aggrid.update()
-
-    async def _handle_card_selection_change(self, _):
-        """Update displayed cards based on grid selection"""
-        selected_rows = await self.cards_aggrid.get_selected_rows()
-        newly_selected_names = {row['name'] for row in selected_rows}
+        """Filter the grid rows in the browser, keeps the selection"""
+        self.cls_aggrid_polars.quick_search(event.value)
 
+    async def _handle_card_selection_change(self, removed: Set[str], added: Set[str]):
+        """Update displayed cards based on grid selection changes"""
         # Remove cards that were deselected
-        cards_to_remove = self.selected_card_names - newly_selected_names
-        for card_name in cards_to_remove:
+        for card_name in removed:
             self._remove_card(card_name)
 
         # Add newly selected cards
-        cards_to_add = newly_selected_names - self.selected_card_names
-        for card_name in cards_to_add:
-            self._create_and_display_card(card_name)
+        for card_name, card_data in self.cls_aggrid_polars.rows_by_key(added).items():
+            self._create_and_display_card(card_name, card_data)
 
-        self.selected_card_names = newly_selected_names
+        self.selected_card_names = (self.selected_card_names - removed) | added
 
-    def _create_and_display_card(self, card_name: str):
+    def _create_and_display_card(self, card_name: str, card_data: dict):
         """Create and display a new card in the grid"""
-        card_data = self.df.filter(pl.col('name') == card_name).to_dicts()[0]
-        if not card_data:
-            return
-
         with self.cards_container:
             with ui.card().classes('w-full h-full').style(
-                    f'height: {self.pageconf.get("card_height")}px; padding: 0') as card:
+                    f'height: {self.pageconf.card_height}px; padding: 0') as card:
                 # Card header
                 with ui.row().classes('w-full flex items-center h-10 bg-[#262b2e]'):
                     ui.label(card_name).classes('flex-grow text-md pl-2')
@@ -179,4 +125,4 @@ class CardsPolarsPage(PageTemplate):
             self.card_ui_elements[card_name].delete()
             self.card_ui_elements.pop(card_name)
             self.selected_card_names.discard(card_name)
-            self.cards_aggrid.run_row_method(card_name, 'setSelected', False)
\ No newline at end of file
+            self.cls_aggrid_polars.ui_grid.run_row_method(card_name, 'setSelected', False)
\ No newline at end of file
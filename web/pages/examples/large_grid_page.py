@@ -0,0 +1,50 @@
+from functools import lru_cache
+
+import polars as pl
+from nicegui import ui
+
+from utils.common.synthetic import cards_frame
+from web.components.aggrid_polars import AgGridPolars
+from web.components.searchindex import SearchIndex
+from web.pagetemplate import PageTemplate
+
+ROWS = 1_000_000
+
+
+@lru_cache(maxsize=1)
+def large_frame(rows: int = ROWS) -> pl.DataFrame:
+    """Synthetic frame shared by all clients, built on first use"""
+    return cards_frame(rows)
+
+
+@lru_cache(maxsize=1)
+def large_frame_index() -> SearchIndex:
+    """Name and description search index of large_frame(), built once"""
+    return SearchIndex(large_frame(), ['name', 'description'])
+
+
+class LargeGridPage(PageTemplate):
+    """AgGridPolars with the infinite row model over a 1M row frame"""
+    progressive = True
+
+    def load_data(self) -> None:
+        self.df = large_frame()
+        self.search_index = large_frame_index()
+
+    def main(self) -> None:
+        ui.label(f"{self.df.height:,} rows, fetched in blocks and sorted/filtered in Polars").classes("text-primary")
+        ui.input(placeholder='Search name and description...',
+                 on_change=lambda e: self.cls_aggrid_polars.search(e.value)) \
+            .props('dense clearable debounce=250').classes('w-full')
+        self.cls_aggrid_polars = AgGridPolars(
+            df=self.df,
+            checkbox_field='name',
+            grid_height=600,
+            on_selection_change=self.handle_selection_change,
+            row_model='infinite',
+            search_index=self.search_index
+        )
+        self.cls_aggrid_polars.create_grid()
+
+    async def handle_selection_change(self, added, removed):
+        pass
@@ -0,0 +1,13 @@
+from nicegui import ui
+
+from web.pagetemplate import PageTemplate
+
+# Served at /examples/param/{name}, e.g. /examples/param/Card 3
+ROUTE_PARAMS = ('name',)
+
+
+class ParamPage(PageTemplate):
+    """Example of a page with route parameters"""
+
+    def main(self) -> None:
+        ui.label(f"name: {self.route_params['name']}").classes("text-primary")
@@ -1,5 +1,6 @@
 from nicegui import ui
 
+from web.components.moduleprofiler import moduleprofiler
 from web.components.modulereloader import ModuleReloader
 from web.pagetemplate import PageTemplate
 
@@ -8,19 +9,40 @@ class ProjectModulesPage(PageTemplate):
     """Implementation of CurrentModulesPage inheriting from PageTemplate."""
 
     def main(self) -> None:
-        """Main content with a table of modules."""
+        """Main content with a table of modules and their import/reload costs."""
         reloader = ModuleReloader()
         project_modules = reloader.get_project_modules()
+
+        rows = []
+        for module in project_modules:
+            stats = moduleprofiler.get(module['name'])
+            rows.append({
+                **module,
+                'import_ms': None if stats.import_time is None else round(stats.import_time * 1000, 2),
+                'memory_kib': None if stats.memory is None else round(stats.memory / 1024, 1),
+                'reload_count': stats.reload_count,
+                'last_reload_ms': None if stats.last_reload is None else round(stats.last_reload * 1000, 2),
+            })
+
+        if not moduleprofiler.installed:
+            ui.label('Import times are collected when the app is started with DASHBOARD_PROFILE_IMPORTS=1 '
+                     '(DASHBOARD_PROFILE_IMPORTS=memory adds tracemalloc memory).').classes('text-grey-5')
+
         columns = [
             {'name': 'name', 'label': 'Name', 'field': 'name', 'required': True, 'align': 'left', 'sortable': True},
             {'name': 'path', 'label': 'Path', 'field': 'path', 'align': 'left', 'sortable': True},
+            {'name': 'import_ms', 'label': 'Import (ms)', 'field': 'import_ms', 'sortable': True},
+            {'name': 'memory_kib', 'label': 'Memory (KiB)', 'field': 'memory_kib', 'sortable': True},
+            {'name': 'reload_count', 'label': 'Reloads', 'field': 'reload_count', 'sortable': True},
+            {'name': 'last_reload_ms', 'label': 'Last reload (ms)', 'field': 'last_reload_ms', 'sortable': True},
         ]
 
         # Create table with sorted modules
         ui.table(
             columns=columns,
-            rows=sorted(project_modules, key=lambda x: x['name']),
-            row_key='name'
+            rows=sorted(rows, key=lambda x: x['name']),
+            row_key='name',
+            pagination=0
         ).classes('w-full')
 
     def events(self) -> None:
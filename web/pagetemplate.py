@@ -1,15 +1,19 @@
 # web/pagetemplate.py
+import inspect
+import json
+import time
 import urllib
 from abc import abstractmethod, ABC
-from typing import Optional
+from typing import Callable, Dict, Optional
 
-from nicegui import ui
-from nicegui.events import KeyEventArguments
+from nicegui import run, ui
+from nicegui.events import GenericEventArguments
 from fastapi import Request
 
+from components.metrics import rendermetrics
 from components.pageconf import globalpageconf
 from components.pageinfo import PageInfo
-from header import create_menu, reload_modules
+from header import add_menu, reload_modules
 
 from loguru import logger
 
@@ -19,21 +23,39 @@ async def on_save():
     await ui.navigate.reload()
 
 
+def normalize_shortcut(combo: str) -> str:
+    """'Q+Ctrl' -> 'ctrl+q', the form built by static/shortcuts.js from a keydown event"""
+    parts = [part.strip().lower() for part in combo.split('+')]
+    modifiers = [modifier for modifier in ('ctrl', 'alt', 'shift', 'meta') if modifier in parts]
+    keys = [part for part in parts if part not in modifiers]
+    if len(keys) != 1:
+        raise ValueError(f"Shortcut '{combo}' must have exactly one non-modifier key")
+    return '+'.join(modifiers + keys)
+
+
 class PageTemplate(ABC):
     """Abstract base class for pages"""
 
+    # Progressive rendering: the header and skeletons are sent first,
+    # load_data (worker thread), sidebar and main are filled once the client is connected
+    progressive: bool = False
+
     def __init__(self, **kwargs):
         self.pageinfo: PageInfo = kwargs.get('pageinfo')  # Type hint for PageInfo
         self.request: Request = kwargs.get('request')    # Type hint for Request
+        self.route_params: dict = kwargs.get('route_params') or {}  # Captured ROUTE_PARAMS segments
         self.query_params = dict(self.request.query_params)
 
         # logger.debug(self.request.url) full url
         # logger.debug(self.request.url.path) route
 
-        self.pageconf = globalpageconf.load(self.pageinfo.route)
+        self.user = globalpageconf.current_user()  # None unless per-user configuration is enabled
+        self.pageconf = globalpageconf.route_conf(self.pageinfo.route, self.user)
+        self.client = ui.context.client
 
         self.ui_left_drawer: Optional[ui.left_drawer] = None
-        self.ui_keyboard: Optional[ui.keyboard] = None
+        self.ui_main_container: Optional[ui.column] = None
+        self._shortcut_handlers: Dict[str, Callable] = {}
 
         self.has_sidebar = self.check_sidebar()
 
@@ -42,18 +64,74 @@ class PageTemplate(ABC):
 
     def render(self):
         """Template method defining the page creation algorithm"""
-        self._add_resources()
-        self._setup_keyboard()
-        self.header()
+        self._render_start = time.perf_counter()
+        self._timed('add_resources', self._add_resources)
+        self._timed('setup_keyboard', self._setup_keyboard)
+        self._timed('header', self.header)
+        if self.progressive:
+            self._create_shell()
+            return
+        if self._overrides('load_data'):
+            self._timed('load_data', self.load_data)
         if self.has_sidebar:
-            self._create_sidebar()
-        self.main()
-        self.events()
+            self._timed('sidebar', self._create_sidebar)
+        self._timed('main', self.main)
+        self._timed('events', self.events)
+        globalpageconf.register_page(self)
+
+    def _create_shell(self):
+        """Send the header with skeleton placeholders, the sections are rendered by _render_deferred"""
+        if self.has_sidebar:
+            with ui.left_drawer().props(f'width={self.pageconf.sidebar_width}') as self.ui_left_drawer:
+                self.skeleton()
+        with ui.column().classes('w-full') as self.ui_main_container:
+            self.skeleton()
+        self._observe('shell', time.perf_counter() - self._render_start)
+        # A timer runs once the client is connected, after the shell has been delivered
+        ui.timer(0, self._render_deferred, once=True)
+
+    async def _render_deferred(self):
+        """Replace the skeletons with load_data (worker thread), sidebar, main and events"""
+        try:
+            if self._overrides('load_data'):
+                start = time.perf_counter()
+                await run.io_bound(self.load_data)
+                self._observe('load_data', time.perf_counter() - start)
+            if self.ui_main_container.is_deleted:
+                return  # client left while the data was loading
+            if self.has_sidebar:
+                self.ui_left_drawer.clear()
+                with self.ui_left_drawer:
+                    self._timed('sidebar', self.sidebar)
+            self.ui_main_container.clear()
+            with self.ui_main_container:
+                self._timed('main', self.main)
+            self._timed('events', self.events)
+        except Exception as e:
+            logger.error(f"Rendering {self.pageinfo.route} failed: {e}")
+            self.ui_main_container.clear()
+            with self.ui_main_container:
+                ui.label(f"Error rendering {self.pageinfo.route}: {e}").classes('text-red-500')
+            return
+        self._observe('complete', time.perf_counter() - self._render_start)
+        globalpageconf.register_page(self)
+
+    def _timed(self, phase: str, method):
+        """Run a render phase and record its duration in the render metrics"""
+        start = time.perf_counter()
+        try:
+            method()
+        finally:
+            self._observe(phase, time.perf_counter() - start)
+
+    def _observe(self, phase: str, seconds: float):
+        rendermetrics.observe(self.pageinfo.route, self.__class__.__name__, phase, seconds)
 
     def _add_resources(self):
         ui.add_head_html('''
             <link rel="stylesheet" href="/static/styles.css">
             <link rel="stylesheet" href="/static/header.css">            
+            <script src="/static/notice.js"></script>
         ''')
 
         if self.has_sidebar:
@@ -62,22 +140,47 @@ class PageTemplate(ABC):
             ''')
 
     def _setup_keyboard(self):
-        """Setup global keyboard shortcuts"""
-        def handle_key(e: KeyEventArguments):
-            # Handle Ctrl+Q to toggle sidebar
-            if (e.modifiers.ctrl and e.key == 'q' and e.action.keydown and not e.action.repeat and self.ui_left_drawer):
-                self.ui_left_drawer.toggle()
-
-        self.ui_keyboard = ui.keyboard(on_key=handle_key)
-        self.ui_keyboard.active = True
+        """Register the page shortcuts in the browser, only a matching key combination reaches the server"""
+        self._shortcut_handlers = {normalize_shortcut(combo): handler
+                                   for combo, handler in self.shortcuts().items()}
+        if not self._shortcut_handlers:
+            return
+        ui.add_head_html(f'''
+            <script src="/static/shortcuts.js"></script>
+            <script>registerShortcuts({json.dumps(sorted(self._shortcut_handlers))});</script>
+        ''')
+        ui.on('shortcut', self._handle_shortcut)
+
+    async def _handle_shortcut(self, e: GenericEventArguments):
+        handler = self._shortcut_handlers.get(e.args)
+        if handler is None:
+            return
+        result = handler()
+        if inspect.isawaitable(result):
+            await result
+
+    def shortcuts(self) -> Dict[str, Callable]:
+        """
+        Keyboard shortcuts of the page, {'ctrl+q': handler}.
+        Override and extend {**super().shortcuts(), ...} to add page shortcuts.
+        """
+        return {'ctrl+q': self.toggle_sidebar}
+
+    def toggle_sidebar(self) -> None:
+        if self.ui_left_drawer:
+            self.ui_left_drawer.toggle()
 
     def check_sidebar(self) -> bool:
         """Check if sidebar is implemented by checking MRO"""
+        return self._overrides('sidebar')
+
+    def _overrides(self, name: str) -> bool:
+        """Check if a method is implemented by a subclass, not only by PageTemplate"""
         # Get method from current class
-        sidebar_method = getattr(self.__class__, 'sidebar', None)
+        method = getattr(self.__class__, name, None)
 
         # Check if method exists and is not from PageTemplate base class
-        return sidebar_method is not None and sidebar_method.__qualname__.split('.')[0] != 'PageTemplate'
+        return method is not None and method.__qualname__.split('.')[0] != 'PageTemplate'
 
     def header(self) -> None:
         with ui.header():
@@ -92,9 +195,10 @@ class PageTemplate(ABC):
                           on_click=lambda: globalpageconf.open_settings_dialog(
                               self.pageinfo,
                               #on_save=on_save
+                              user=self.user
                           )).props('flat color=white')
                 # Center - navigation menu
-                ui.html(create_menu())
+                add_menu()
 
             # Right side - Module controls
             with ui.row().classes('gap-2'):
@@ -103,7 +207,7 @@ class PageTemplate(ABC):
 
     def _create_sidebar(self) -> None:
         """Creates the sidebar structure with proper container"""
-        width = self.pageconf.get('sidebar_width')  # or any value you want
+        width = self.pageconf.sidebar_width  # or any value you want
         with ui.left_drawer().props(f'width={width}') as self.ui_left_drawer:
             self.sidebar()
 
@@ -111,11 +215,32 @@ class PageTemplate(ABC):
         """Override this method to provide sidebar content"""
         pass
 
+    def load_data(self) -> None:
+        """
+        Override to compute the page data before sidebar and main are rendered.
+        Runs in a worker thread in progressive mode, so it must not create UI elements.
+        """
+        pass
+
+    def skeleton(self) -> None:
+        """Placeholder shown in progressive mode until a section is rendered"""
+        for _ in range(3):
+            ui.skeleton(height='6rem').classes('w-full q-mb-md')
+
     @abstractmethod
     def main(self) -> None:
         """Abstract method for main content, must be implemented by subclasses"""
         pass
 
+    def apply_pageconf(self, pageconf, changed: set) -> None:
+        """
+        Apply a changed page configuration in place, without rebuilding the page.
+        Override to handle page specific keys, call super() to keep the sidebar handling.
+        """
+        self.pageconf = pageconf
+        if 'sidebar_width' in changed and self.ui_left_drawer:
+            self.ui_left_drawer.props(f'width={pageconf.sidebar_width}')
+
     def events(self) -> None:
         """Events implementation, default is empty (no events)"""
         pass
\ No newline at end of file
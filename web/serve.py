@@ -0,0 +1,91 @@
+"""
+Run several dashboard worker processes behind one port.
+
+Each worker is a regular `web/app.py` process listening on its own port (port+1 .. port+N).
+A small TCP proxy on `port` pins every client IP to one worker, so the NiceGUI websocket
+and the page it belongs to always end up in the same process.
+
+Workers share pageconf.yaml (file lock, reloaded on change) and follow module reloads
+triggered in any other worker (web/.reload_stamp).
+
+Usage:
+    python web/serve.py --workers 4 --port 8000
+"""
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import zlib
+from pathlib import Path
+
+from loguru import logger
+
+APP_FILE = Path(__file__).parent / 'app.py'
+
+
+def start_workers(workers: int, port: int) -> list:
+    """Start worker processes on port+1 .. port+workers"""
+    processes = []
+    for i in range(1, workers + 1):
+        env = dict(os.environ, DASHBOARD_PORT=str(port + i))
+        processes.append(subprocess.Popen([sys.executable, str(APP_FILE)], env=env))
+        logger.info(f"Worker {i} started on port {port + i}")
+    return processes
+
+
+async def pipe(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    try:
+        while data := await reader.read(65536):
+            writer.write(data)
+            await writer.drain()
+    except ConnectionError:
+        pass
+    finally:
+        writer.close()
+
+
+async def run_proxy(host: str, port: int, backend_ports: list):
+    """Sticky TCP proxy: the client IP picks the worker"""
+
+    async def handle_client(client_reader, client_writer):
+        client_ip = client_writer.get_extra_info('peername')[0]
+        backend_port = backend_ports[zlib.crc32(client_ip.encode()) % len(backend_ports)]
+        try:
+            backend_reader, backend_writer = await asyncio.open_connection('127.0.0.1', backend_port)
+        except ConnectionError as e:
+            logger.error(f"Worker on port {backend_port} unavailable: {e}")
+            client_writer.close()
+            return
+        await asyncio.gather(
+            pipe(client_reader, backend_writer),
+            pipe(backend_reader, client_writer)
+        )
+
+    server = await asyncio.start_server(handle_client, host, port)
+    logger.info(f"Serving {len(backend_ports)} workers on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=os.cpu_count())
+    parser.add_argument('--host', default='0.0.0.0')
+    parser.add_argument('--port', type=int, default=8000)
+    args = parser.parse_args()
+
+    processes = start_workers(args.workers, args.port)
+    try:
+        asyncio.run(run_proxy(args.host, args.port, [args.port + i for i in range(1, args.workers + 1)]))
+    except KeyboardInterrupt:
+        logger.debug('SIGINT received, stopping workers ...')
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.wait()
+
+
+if __name__ == '__main__':
+    main()
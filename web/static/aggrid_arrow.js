@@ -0,0 +1,54 @@
+// Loads AgGridPolars rows sent as an Arrow IPC stream, the gzip Content-Encoding is decoded by the browser
+function isoDate(value) {
+    // Date columns arrive as date32, rowData JSON carries them as 'YYYY-MM-DD'
+    return value == null ? null : new Date(value).toISOString().slice(0, 10);
+}
+
+function loadArrowJs(src) {
+    // The bundle is fetched once, by the first 'arrow' grid of the page
+    if (typeof Arrow !== 'undefined') return Promise.resolve();
+    if (!window.arrowJsLoading) {
+        window.arrowJsLoading = new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = src;
+            script.onload = resolve;
+            script.onerror = () => {
+                window.arrowJsLoading = null;
+                reject(new Error(`${src} could not be loaded`));
+            };
+            document.head.appendChild(script);
+        });
+    }
+    return window.arrowJsLoading;
+}
+
+function showArrowError(api, error) {
+    // Shown in place of the rows, so a missing Arrow JS or a failed request does not leave an empty grid
+    console.error('AgGridPolars: loading Arrow rows failed', error);
+    const message = document.createElement('span');
+    message.textContent = `Loading rows failed: ${error.message}`;
+    api.setGridOption('overlayNoRowsTemplate', message.outerHTML);
+    api.showNoRowsOverlay();
+}
+
+async function loadArrowRows(api, url, arrowJsUrl) {
+    try {
+        const [response] = await Promise.all([fetch(url), loadArrowJs(arrowJsUrl)]);
+        if (!response.ok) throw new Error(`${url} answered HTTP ${response.status}`);
+        const table = Arrow.tableFromIPC(await response.arrayBuffer());
+        // Array.from keeps nulls, a typed array from toArray() would turn them into 0
+        const columns = table.schema.fields.map((field) => {
+            const values = Array.from(table.getChild(field.name));
+            return [field.name, Arrow.DataType.isDate(field.type) ? values.map(isoDate) : values];
+        });
+        const rows = new Array(table.numRows);
+        for (let i = 0; i < table.numRows; i++) {
+            const row = {};
+            for (const [name, values] of columns) row[name] = values[i];
+            rows[i] = row;
+        }
+        api.setGridOption('rowData', rows);
+    } catch (error) {
+        showArrowError(api, error);
+    }
+}
@@ -0,0 +1,2 @@
+// Quick search text per AgGridPolars grid id, tested by the grid's external filter against the row search key
+window.aggridQuickSearch = window.aggridQuickSearch || {};
@@ -0,0 +1,13 @@
+// Selected row ids per AgGridPolars grid id, each selectionChanged sends only the {added, removed} ids to the server
+window.aggridSelection = window.aggridSelection || {};
+
+function emitSelectionDelta(api, gridId, field) {
+    const previous = aggridSelection[gridId] || new Set();
+    const current = new Set(api.getSelectedNodes().map((node) => node.data[field]));
+    const added = [];
+    const removed = [];
+    for (const id of current) if (!previous.has(id)) added.push(id);
+    for (const id of previous) if (!current.has(id)) removed.push(id);
+    aggridSelection[gridId] = current;
+    if (added.length || removed.length) emitEvent(`aggrid_selection_${gridId}`, {added, removed});
+}
@@ -0,0 +1,7 @@
+// Shows the notice a page left in sessionStorage before a full reload (header.reload_with_notice)
+window.addEventListener('load', () => {
+    const notice = sessionStorage.getItem('dashboard_notice');
+    if (!notice) return;
+    sessionStorage.removeItem('dashboard_notice');
+    Quasar.Notify.create(JSON.parse(notice));
+});
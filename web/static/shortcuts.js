@@ -0,0 +1,28 @@
+// Keyboard shortcuts matched in the browser, only a registered combination is sent to the server
+(function () {
+    if (window.registerShortcuts) return;
+
+    const IGNORED_TAGS = ['INPUT', 'SELECT', 'BUTTON', 'TEXTAREA'];
+    const shortcuts = new Set();
+
+    // Same normalization as PageTemplate: modifiers in ctrl, alt, shift, meta order, then the key
+    function comboOf(e) {
+        const parts = [];
+        if (e.ctrlKey) parts.push('ctrl');
+        if (e.altKey) parts.push('alt');
+        if (e.shiftKey) parts.push('shift');
+        if (e.metaKey) parts.push('meta');
+        parts.push(e.key.toLowerCase());
+        return parts.join('+');
+    }
+
+    document.addEventListener('keydown', (e) => {
+        if (e.repeat || !shortcuts.size || IGNORED_TAGS.includes(e.target.tagName) || e.target.isContentEditable) return;
+        const combo = comboOf(e);
+        if (!shortcuts.has(combo)) return;
+        e.preventDefault();
+        emitEvent('shortcut', combo);
+    });
+
+    window.registerShortcuts = (combos) => combos.forEach((combo) => shortcuts.add(combo));
+})();
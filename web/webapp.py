@@ -1,15 +1,81 @@
 from nicegui import ui, app
 from fastapi import Request
-import importlib
-from components.pageinfo import PageInfo
+from fastapi.responses import PlainTextResponse, Response
+import gzip
+import time
+from components.metrics import rendermetrics, dispatch_to_prometheus
+from components.pageconf import globalpageconf
+from components.pageconfstore import PageConfStore
 from components.pagemanager import pagemanager
+from components.pagewatcher import PageWatcher
 
-from header import create_menu, reload_modules
+# Same module object as the pages use, it holds the grid registry
+from web.components.aggrid_polars import AgGridPolars
+from header import add_menu, menu_script, reload_modules, reload_if_notified
 from loguru import logger
 
-def webapp():
+def webapp(prewarm: bool = False, watch_pages: bool = False, pageconf_db: str = None):
+    """
+    Register the static files and page routes.
+
+    Args:
+        prewarm: Import all page modules in a thread pool before serving
+        watch_pages: Add and remove routes live when files under web/pages change
+        pageconf_db: SQLite file of per-user page configuration, layered over pageconf.yaml
+    """
     app.add_static_files('/static', 'web/static')
 
+    @app.get('/metrics')
+    def metrics():
+        """Render phase and dispatch timings in Prometheus text format"""
+        body = rendermetrics.to_prometheus() + dispatch_to_prometheus(pagemanager.routetable.get_timings())
+        return PlainTextResponse(body, media_type='text/plain; version=0.0.4')
+
+    @app.get('/menu.js')
+    def menu_js(request: Request):
+        """Navigation menu script, revalidated by ETag"""
+        script, etag = menu_script()
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+        if request.headers.get('if-none-match') == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(script, media_type='application/javascript', headers=headers)
+
+    @app.post('/aggrid/{grid_id}/rows')
+    def aggrid_rows(grid_id: str, body: dict):
+        """Row blocks of AgGridPolars grids using the infinite row model"""
+        grid = AgGridPolars.get(grid_id)
+        if grid is None:
+            return Response(status_code=404)
+        return Response(grid.rows_json(body), media_type='application/json')
+
+    @app.get('/aggrid/{grid_id}/arrow')
+    def aggrid_arrow(grid_id: str, request: Request):
+        """Rows of AgGridPolars grids using transfer='arrow', gzip encoded when the browser accepts it"""
+        grid = AgGridPolars.get(grid_id)
+        if grid is None:
+            return Response(status_code=404)
+        body = grid.arrow_ipc()
+        headers = {}
+        if 'gzip' in request.headers.get('accept-encoding', ''):
+            # Level 1: most of the size gain at a fraction of the CPU of level 6
+            body = gzip.compress(body, compresslevel=1)
+            headers['Content-Encoding'] = 'gzip'
+        return Response(body, media_type='application/vnd.apache.arrow.stream', headers=headers)
+
+    if prewarm:
+        pagemanager.prewarm()
+
+    if pageconf_db:
+        globalpageconf.use_store(PageConfStore(pageconf_db))
+
+    # Push pageconf.yaml changes to open pages
+    app.on_startup(globalpageconf.watch_file)
+
+    if watch_pages:
+        pagewatcher = PageWatcher(pagemanager)
+        pagewatcher.start()
+        app.on_shutdown(pagewatcher.stop)
+
     @ui.page('/{path:path}')
     async def dynamic_module_page(request: Request):
 
@@ -18,27 +84,23 @@ def webapp():
         venue = path.split('/')[0] if '/' in path else None
         route = f'/{path}'
 
-        pages = pagemanager.get_pages()
-        pageinfo: PageInfo = pages.get(route)
-        # logger.debug(pageinfo)
+        # Follow module reloads triggered in other worker processes
+        await reload_if_notified()
+        entry, route_params = pagemanager.match(route)
 
-        if pageinfo is not None:
-            module = None
+        if entry is None:
+            any_page(route)
+        elif entry.error:
+            any_page(route, entry.error)
+        else:
             try:
-                module = importlib.import_module(pageinfo.modulepath)
-                if hasattr(module, pageinfo.classname):
-                    ModuleClass = getattr(module, pageinfo.classname)
-                    ModuleClass(pageinfo=pageinfo, request=request)
-                else:
-                    error_msg = f"Class {pageinfo.classname} not found in module"
-                    logger.error(error_msg)
-                    any_page(route, error_msg)
+                start = time.perf_counter()
+                entry.page_class(pageinfo=entry.pageinfo, request=request, route_params=route_params)
+                pagemanager.routetable.record('build', time.perf_counter() - start)
             except Exception as e:
-                error_msg = f"Error instantiating {'unknown module' if module is None else module}\n {pageinfo}: \n{str(e)}"
+                error_msg = f"Error instantiating {entry.page_class}\n {entry.pageinfo}: \n{str(e)}"
                 logger.error(error_msg)
                 any_page(route, error_msg)
-        else:
-            any_page(route)
 
     @ui.page('/')
     def any_page(route, error_message=None):
@@ -48,7 +110,7 @@ def webapp():
         with ui.header():
             with ui.row().classes('items-center'):
                 ui.label("/").classes('text-white text-xl font-bold').style('width: 350px;')
-                ui.html(create_menu())
+                add_menu()
                 # Right side - Module controls
                 with ui.row().classes('gap-2'):
                     ui.button(icon='sync', on_click=reload_modules).props(
@@ -61,6 +123,7 @@ def webapp():
 
 
 def webapp_shutdown():
+    globalpageconf.flush()
     app.storage.clear()
     app.shutdown()
     logger.debug('SIGINT received, aborting ...')
\ No newline at end of file